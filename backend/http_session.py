@@ -0,0 +1,40 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Seconds a request may take when the caller doesn't pass its own timeout
+DEFAULT_TIMEOUT = 10
+
+
+class _TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to requests made without one."""
+
+    def __init__(self, timeout):
+        super().__init__()
+        self._default_timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self._default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+def make_session(timeout=DEFAULT_TIMEOUT, pool_maxsize: int = 8) -> requests.Session:
+    """
+    Keep-alive HTTP session shared by the backend modules and the Streamlit app, so every caller
+    gets the same pooling, retry policy and default timeout.
+    Failed connects are retried twice, as are 502/504 answers to idempotent requests. Read timeouts
+    are not retried, so a slow service costs one timeout. The final response is returned rather than
+    raised, so callers can read its error detail.
+    """
+    session = _TimeoutSession(timeout)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=2, read=False, backoff_factor=0.2,
+            status_forcelist=[502, 504], raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -7,7 +7,7 @@ from dotenv import load_dotenv, find_dotenv
 _ = load_dotenv(find_dotenv(usecwd=True), override=True)
 
 from backend.zendesk.zendesk_integration import ZendeskIntegration
-from backend.zammad.zammad_integration import initialize_zammad_client
+from backend.zammad.zammad_integration import get_zammad_client
 from .routers.zendesk_routes import router as zendesk_router
 from .routers.zammad_routes import router as zammad_router
 from .routers.classifier_routes import router as classifier_router
@@ -22,9 +22,9 @@ async def lifespan(app: FastAPI):
         # Defer fatal errors to endpoint-level checks to keep the server up
         app.state.zendesk = None
         print(f"[lifespan] Warning: Zendesk integration failed to init: {e}")
-    # Initialize Zammad client
+    # Initialize Zammad client (the process-wide one, shared with helpers such as group_tools.ensure_group)
     try:
-        app.state.zammad = initialize_zammad_client()
+        app.state.zammad = get_zammad_client()
         app.state.zammad_error = None
     except Exception as e:
         app.state.zammad = None
@@ -1,6 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, Request
-import requests
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from ..schemas.zammad import (
     ZammadTicketCreateRequest,
@@ -8,20 +8,39 @@ from ..schemas.zammad import (
     ZammadTicketUpdateRequest,
     ZammadTicketUpdateResponse,
     ZammadTicketDeleteResponse,
+    ZammadBulkUpdateRequest,
+    ZammadBulkDeleteRequest,
+    ZammadBulkResponse,
+    ZammadRefsResolveRequest,
+    ZammadRefsResolveResponse,
 )
 
+from backend.http_session import make_session
+
 # Reuse integration helpers from backend package
 from backend.zammad.zammad_integration import (
     get_all_groups,
     find_or_create_customer,
+    PRIORITY_IDS,
     list_tickets as zammad_list_tickets,
+    search_tickets as zammad_search_tickets,
     get_ticket as zammad_get_ticket,
     update_ticket as zammad_update_ticket,
     delete_ticket as zammad_delete_ticket,
+    get_lookup_maps as zammad_get_lookup_maps,
+    resolve_refs as zammad_resolve_refs,
+    bulk_update_tickets as zammad_bulk_update_tickets,
+    bulk_delete_tickets as zammad_bulk_delete_tickets,
 )
 
 router = APIRouter()
 
+# Upper bound for one list/search page; keeps list responses small enough to decode in one go
+MAX_LIST_LIMIT = 200
+
+# Normalized customer email -> Zammad customer_id, shared across requests
+_customer_cache: dict[str, int] = {}
+
 
 def get_client(request: Request):
     client = getattr(request.app.state, "zammad", None)
@@ -36,16 +55,31 @@ def get_client(request: Request):
     return client
 
 
+def _resolve_customer_id(client, email: str, firstname: str, lastname: str) -> Optional[int]:
+    """Return the customer id for `email`, memoized so repeat requesters skip the user search."""
+    key = (email or "").strip().lower()
+    customer_id = _customer_cache.get(key)
+    if customer_id is None:
+        customer_id = find_or_create_customer(client, email=email, firstname=firstname, lastname=lastname)
+        if customer_id:
+            _customer_cache[key] = customer_id
+    return customer_id
+
+
 @router.get("/health")
 def zammad_health(request: Request) -> dict:
     ok = getattr(request.app.state, "zammad", None) is not None
     return {"status": "ok" if ok else "unavailable"}
 
 
+# Keep-alive session for the loopback classifier call made on every ticket create
+_CLASSIFIER_SESSION = make_session()
+
+
 def _classify(description: str) -> tuple[Optional[str], Optional[str]]:
     """Call embedded classifier API to get (priority, department)."""
     try:
-        resp = requests.post(
+        resp = _CLASSIFIER_SESSION.post(
             "http://127.0.0.1:8000/api/v1/classifier/predict",
             json={"description": description},
             timeout=4,
@@ -63,18 +97,20 @@ def _classify(description: str) -> tuple[Optional[str], Optional[str]]:
 def list_tickets(
     request: Request,
     state_id: int | None = None,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_LIST_LIMIT),
+    offset: int = Query(0, ge=0),
 ):
-    """List Zammad tickets. Optional filter by state_id and limit results.
+    """List Zammad tickets. Optional filter by state_id and limit/offset paging.
 
     Examples:
     - /api/v1/zammad/tickets
     - /api/v1/zammad/tickets?state_id=4
     - /api/v1/zammad/tickets?limit=20
+    - /api/v1/zammad/tickets?limit=20&offset=40
     """
     try:
         client = get_client(request)
-        items = zammad_list_tickets(client, state_id=state_id, limit=limit)
+        items = zammad_list_tickets(client, state_id=state_id, limit=limit, offset=offset)
         return {"count": len(items), "tickets": items}
     except HTTPException:
         raise
@@ -87,11 +123,20 @@ def list_tickets(
 def list_tickets_v2(
     request: Request,
     state_id: int | None = None,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_LIST_LIMIT),
+    offset: int = Query(0, ge=0),
+    q: str | None = None,
+    field: str = "title",
 ):
+    """List tickets; with `q`, return tickets whose `field` ("title" or "email") matches it.
+    Search responses also carry `truncated`: True when the fallback sweep stopped before checking older tickets.
+    """
     try:
         client = get_client(request)
-        items = zammad_list_tickets(client, state_id=state_id, limit=limit)
+        if q:
+            items, truncated = zammad_search_tickets(client, q, field=field, limit=limit)
+            return {"count": len(items), "tickets": items, "truncated": truncated}
+        items = zammad_list_tickets(client, state_id=state_id, limit=limit, offset=offset)
         return {"count": len(items), "tickets": items}
     except HTTPException:
         raise
@@ -99,6 +144,36 @@ def list_tickets_v2(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/lookups")
+def get_lookups(request: Request, refresh: bool = False):
+    """id -> name maps for ticket states, priorities and groups; `refresh` bypasses the server-side cache."""
+    try:
+        client = get_client(request)
+        return zammad_get_lookup_maps(client, refresh=refresh)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/refs/resolve", response_model=ZammadRefsResolveResponse)
+def resolve_refs(request: Request, payload: ZammadRefsResolveRequest):
+    """Resolve state/priority/customer/group IDs of a ticket list to names in one round trip."""
+    try:
+        client = get_client(request)
+        return zammad_resolve_refs(
+            client,
+            state_ids=payload.state_ids,
+            priority_ids=payload.priority_ids,
+            customer_ids=payload.customer_ids,
+            group_ids=payload.group_ids,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/tickets/{ticket_id}")
 def get_ticket(request: Request, ticket_id: int):
     try:
@@ -149,30 +224,57 @@ def delete_ticket(request: Request, ticket_id: int):
         raise HTTPException(status_code=500, detail=msg)
 
 
+# Bulk endpoints use distinct paths so they don't collide with /tickets/{ticket_id}
+@router.post("/tickets/bulk_update", response_model=ZammadBulkResponse)
+def bulk_update_tickets(request: Request, payload: ZammadBulkUpdateRequest):
+    try:
+        client = get_client(request)
+        data = payload.update.model_dump(exclude_none=True)
+        result = zammad_bulk_update_tickets(client, payload.ids, data)
+        return ZammadBulkResponse(success=not result["failed"], **result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/tickets/bulk_delete", response_model=ZammadBulkResponse)
+def bulk_delete_tickets(request: Request, payload: ZammadBulkDeleteRequest):
+    try:
+        client = get_client(request)
+        result = zammad_bulk_delete_tickets(client, payload.ids)
+        return ZammadBulkResponse(success=not result["failed"], **result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/tickets", response_model=ZammadTicketCreateResponse)
 def create_ticket(payload: ZammadTicketCreateRequest, client=Depends(get_client)) -> Any:
     try:
-        # Resolve or create customer
-        customer_id = find_or_create_customer(
-            client,
-            email=payload.customer_email,
-            firstname=payload.customer_firstname,
-            lastname=payload.customer_lastname,
-        )
+        # Customer, group map and classification are independent round-trips, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            customer_job = pool.submit(
+                _resolve_customer_id,
+                client,
+                email=payload.customer_email,
+                firstname=payload.customer_firstname,
+                lastname=payload.customer_lastname,
+            )
+            groups_job = pool.submit(get_all_groups, client)
+            classify_job = pool.submit(_classify, payload.description) if payload.use_ai else None
+            customer_id = customer_job.result()
+            groups = groups_job.result()
+            classified_priority, classified_department = classify_job.result() if classify_job else (None, None)
+
         if not customer_id:
             return ZammadTicketCreateResponse(success=False, error="Unable to resolve customer", diagnostics={"stage": "find_or_create_customer"})
 
         # Determine group
-        groups = get_all_groups(client)
         group_id = None
         chosen_group_name: Optional[str] = None
 
-        classified_priority: Optional[str] = None
-        classified_department: Optional[str] = None
-
-        if payload.use_ai:
-            classified_priority, classified_department = _classify(payload.description)
-
         # 1) Explicit group in payload
         if payload.group_name and payload.group_name in groups:
             chosen_group_name = payload.group_name
@@ -189,10 +291,9 @@ def create_ticket(payload: ZammadTicketCreateRequest, client=Depends(get_client)
             group_id = 1  # final fallback
 
         # Priority mapping
-        priority_map = {"low": 1, "normal": 2, "medium": 2, "high": 3}
         priority_id = 2  # default normal
         if classified_priority:
-            priority_id = priority_map.get(classified_priority.lower(), 2)
+            priority_id = PRIORITY_IDS.get(classified_priority.lower().strip(), 2)
 
         # Create ticket
         params = {
@@ -208,7 +309,12 @@ def create_ticket(payload: ZammadTicketCreateRequest, client=Depends(get_client)
             },
         }
 
-        ticket = client.ticket.create(params=params)
+        try:
+            ticket = client.ticket.create(params=params)
+        except Exception:
+            # The cached customer may be stale (e.g. deleted in Zammad); re-resolve next time
+            _customer_cache.pop(payload.customer_email.strip().lower(), None)
+            raise
         ticket_id = ticket.get("id") if isinstance(ticket, dict) else None
         ticket_number = ticket.get("number") if isinstance(ticket, dict) else None
 
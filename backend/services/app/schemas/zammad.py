@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
 
@@ -63,3 +63,34 @@ class ZammadTicketDeleteResponse(BaseModel):
     message: Optional[str] = None
     ticket: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+
+
+class ZammadBulkUpdateRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=100, description="Ticket IDs to update (max 100 per request)")
+    update: ZammadTicketUpdateRequest
+
+
+class ZammadBulkDeleteRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=100, description="Ticket IDs to delete/close (max 100 per request)")
+
+
+class ZammadRefsResolveRequest(BaseModel):
+    state_ids: List[int] = Field(default_factory=list, max_length=500)
+    priority_ids: List[int] = Field(default_factory=list, max_length=500)
+    customer_ids: List[int] = Field(default_factory=list, max_length=500)
+    group_ids: List[int] = Field(default_factory=list, max_length=500)
+
+
+class ZammadRefsResolveResponse(BaseModel):
+    states: Dict[int, str] = Field(default_factory=dict)
+    priorities: Dict[int, str] = Field(default_factory=dict)
+    customers: Dict[int, str] = Field(default_factory=dict)
+    groups: Dict[int, str] = Field(default_factory=dict)
+
+
+class ZammadBulkResponse(BaseModel):
+    success: bool
+    succeeded: List[int] = Field(default_factory=list)
+    failed: Dict[int, str] = Field(default_factory=dict)
+    # Bulk delete only: succeeded ids that could not be destroyed and were closed instead
+    closed: List[int] = Field(default_factory=list)
@@ -1,16 +1,23 @@
 import streamlit as st
 import os
-import json
+import math
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from dotenv import load_dotenv
-import requests
+import orjson
+import pandas as pd
 
 # Add the current directory to Python path to import our modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import our integration modules
 from zammad.zammad_api import check_classifier_health
+from http_session import make_session
 
 # Load environment variables
 load_dotenv()
@@ -18,6 +25,91 @@ load_dotenv()
 # Backend API base for FastAPI services
 API_BASE = os.getenv('ROUTEIQ_API_BASE', 'http://127.0.0.1:8000/api/v1')
 
+# Number of tickets fetched per page in "View All Tickets"
+TICKETS_PAGE_SIZE = 50
+# Formatted rows are kept per (ticket_id, updated_at); bound the cache so long sessions don't grow it forever
+FORMATTED_TICKET_TTL = 600
+FORMATTED_TICKET_MAX_ENTRIES = 2000
+# A repeat of the same write within this many seconds is treated as a double-click
+DUPLICATE_SUBMIT_WINDOW = 3
+# (connect, read) timeout for health probes; the backend is local, so a healthy one answers in milliseconds
+HEALTH_TIMEOUT = (1.5, 2.0)
+# Seconds a ticket table waits for the background lookup-map fetch before showing raw IDs
+LOOKUPS_WAIT = 5
+
+# Shown when a search fell back to the backend's capped sweep (no search index)
+SEARCH_TRUNCATED_NOTE = "Zammad's search index was unavailable, so only the most recent tickets were checked."
+
+# Search type -> `field` query param of the /zammad/tickets search
+SEARCH_FIELDS = {"Title": "title", "Customer Email": "email"}
+SEARCH_TYPES = ("Ticket ID", "Customer Email", "Title")
+
+# Max ticket IDs per bulk update/delete request (backend limit)
+BULK_CHUNK_SIZE = 100
+
+# Column order of the records appended to st.session_state.ticket_history
+HISTORY_COLUMNS = ['system', 'title', 'customer_email', 'created_at', 'ticket_id']
+# Ticket history keeps only the most recent records, so long sessions don't grow it (or its table) forever
+TICKET_HISTORY_MAX = 500
+
+# Environment variables shown (pre-filled) in the Settings tab
+SETTINGS_ENV_VARS = (
+    "ZAMMAD_URL", "ZAMMAD_HTTP_TOKEN", "ZAMMAD_USERNAME", "ZAMMAD_PASSWORD",
+    "ZENDESK_EMAIL", "ZENDESK_TOKEN", "ZENDESK_SUBDOMAIN",
+)
+
+# Fixed select-box options, built once instead of on every rerun
+TICKET_SYSTEMS = ("Zammad", "Zendesk")
+ZAMMAD_GROUP_OPTIONS = ("Auto (Use AI)", "Users")
+THEMES = ("Light", "Dark")
+
+# Update form select-box options ("" means leave unchanged)
+ZAMMAD_STATES = ("", "new", "open", "pending reminder", "pending close", "closed")
+ZAMMAD_PRIORITIES = ("", "1 low", "2 normal", "3 high")
+ZENDESK_STATUSES = ("", "new", "open", "pending", "hold", "solved", "closed")
+ZENDESK_PRIORITIES = ("", "low", "normal", "high", "urgent")
+# Update payload field -> widget key in the update form, per system
+UPDATE_FORM_FIELDS = {
+    "Zammad": (("title", "update_title"), ("state", "update_state"), ("priority", "update_priority")),
+    "Zendesk": (("subject", "update_subject"), ("status", "update_status"), ("priority", "update_priority_zd")),
+}
+
+# Zammad ticket field -> (display column, label used when the ID is shown unresolved)
+ZAMMAD_DISPLAY_FIELDS = (
+    ('id', 'ID', None),
+    ('title', 'Title', None),
+    ('state_id', 'State', 'State ID'),
+    ('priority_id', 'Priority', 'Priority ID'),
+    ('customer_id', 'Customer', 'Customer ID'),
+    ('group_id', 'Group', 'Group ID'),
+    ('created_at', 'Created', None),
+    ('updated_at', 'Updated', None),
+)
+
+# Column order of the ticket table per system (the keys `format_ticket_for_display` returns)
+TICKET_DISPLAY_COLUMNS = {
+    "Zammad": tuple(column for _, column, _ in ZAMMAD_DISPLAY_FIELDS),
+    "Zendesk": ("ID", "Subject", "Status", "Priority", "Requester ID", "Assignee ID", "Created", "Updated"),
+}
+
+# Zammad ticket field -> key of its id -> name map (/zammad/lookups, customers via /zammad/refs/resolve)
+ZAMMAD_LOOKUP_KEYS = {'state_id': 'states', 'priority_id': 'priorities', 'customer_id': 'customers', 'group_id': 'groups'}
+
+# Native column types for ticket tables, so IDs and timestamps are not shipped as strings
+_TIMESTAMP_COLUMNS = {
+    "Created": st.column_config.DatetimeColumn("Created"),
+    "Updated": st.column_config.DatetimeColumn("Updated"),
+}
+TICKET_COLUMN_CONFIG = {
+    "Zammad": {"ID": st.column_config.NumberColumn("ID", format="%d"), **_TIMESTAMP_COLUMNS},
+    "Zendesk": {
+        "ID": st.column_config.NumberColumn("ID", format="%d"),
+        "Requester ID": st.column_config.NumberColumn("Requester ID", format="%d"),
+        "Assignee ID": st.column_config.NumberColumn("Assignee ID", format="%d"),
+        **_TIMESTAMP_COLUMNS,
+    },
+}
+
 # Page configuration
 st.set_page_config(
     page_title="RouteIQ Ticket Management",
@@ -26,8 +118,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling.
+# Streamlit drops elements that are not re-emitted, so this must render on every rerun;
+# keep it to the classes the app actually uses.
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -41,36 +135,58 @@ st.markdown("""
         margin-top: 2rem;
         margin-bottom: 1rem;
     }
-    .success-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        color: #155724;
-    }
-    .error-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        color: #721c24;
-    }
-    .info-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        background-color: #d1ecf1;
-        border: 1px solid #bee5eb;
-        color: #0c5460;
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Admin steps shown after ticket creation when the API user lacks permissions on the ticket's group
+GRANT_PERMISSIONS_STEPS = (
+    "ACTION REQUIRED: Grant permissions for the {kind} department/group\n"
+    "1. Go to Admin > Roles\n"
+    "2. Edit the appropriate role for the API user\n"
+    "3. Under 'Group Permissions', set '{group}' to 'Full'\n"
+    "4. Save changes\n"
+    "Once granted, future tickets will be created directly in this group without fallback."
+)
+
+# Divider and footer in one markdown element, so each rerun sends a single delta for them
+FOOTER_HTML = (
+    '---\n\n'
+    '<div style="text-align: center; color: #666; margin-top: 2rem;">'
+    '🎫 RouteIQ Ticket Management System | Built with Streamlit'
+    '</div>'
+)
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Initialize session state
 if 'ticket_history' not in st.session_state:
-    st.session_state.ticket_history = []
+    st.session_state.ticket_history = deque(maxlen=TICKET_HISTORY_MAX)
 
 ## Removed legacy client initialization; all operations now use FastAPI
 
+@st.cache_data(ttl=60, show_spinner=False)
+def env_snapshot():
+    """Environment variables shown in the sidebar check and Settings tab, re-read at most once a minute."""
+    return {var: os.getenv(var, '') for var in SETTINGS_ENV_VARS}
+
+def _error_detail(resp):
+    """Error message of a failed FastAPI response: the JSON `detail` when present, else the raw body."""
+    if 'json' in resp.headers.get('content-type', ''):
+        try:
+            return orjson.loads(resp.content).get('detail') or resp.text
+        except (ValueError, AttributeError):
+            pass
+    return resp.text
+
+@st.cache_resource
+def get_session():
+    """Process-wide keep-alive HTTP session for FastAPI calls, so reruns reuse pooled connections.
+    Uses the shared retry policy (see `make_session`): a 503 is the backend's "not configured" answer,
+    so it is never retried, and callers get the last response to read its `detail`.
+    """
+    # Room for the prefetch and health pools alongside the script thread
+    return make_session(pool_maxsize=20)
+
 ## Removed legacy Zammad ticket creation helpers (SDK- and module-based)
 
 def fastapi_zammad_create_ticket(ticket_data):
@@ -78,14 +194,11 @@ def fastapi_zammad_create_ticket(ticket_data):
     try:
         # Prepare API request
         url = f"{API_BASE}/zammad/tickets"
-        response = requests.post(url, json=ticket_data, timeout=20)
+        response = get_session().post(url, json=ticket_data, timeout=20)
         if response.ok:
-            return response.json(), None
+            return orjson.loads(response.content), None
         # Try to surface backend-provided detail
-        try:
-            return None, response.json().get("detail") or response.text
-        except Exception:
-            return None, response.text
+        return None, _error_detail(response)
     except Exception as e:
         return None, str(e)
 
@@ -93,38 +206,36 @@ def fastapi_zammad_health():
     """Check Zammad API health via FastAPI backend."""
     try:
         url = f"{API_BASE}/zammad/health"
-        resp = requests.get(url, timeout=10)
+        resp = get_session().get(url, timeout=HEALTH_TIMEOUT)
         if resp.ok:
-            return resp.json(), None
-        try:
-            return None, resp.json().get('detail') or resp.text
-        except Exception:
-            return None, resp.text
+            return orjson.loads(resp.content), None
+        return None, _error_detail(resp)
     except Exception as e:
         return None, str(e)
 
-def fastapi_zammad_list_tickets():
-    """List tickets via FastAPI backend. Uses v2 endpoint and falls back if needed."""
+def fastapi_zammad_list_tickets(limit: int = 50, offset: int = 0, query=None, field=None):
+    """List one page of tickets via FastAPI backend. Uses v2 endpoint and falls back if needed.
+    With `query`, the backend returns only tickets whose `field` ("title"/"email") contains it.
+    Pages are capped server-side (MAX_LIST_LIMIT), so the body is decoded whole.
+    """
     try:
         url = f"{API_BASE}/zammad/tickets"
-        resp = requests.get(url, timeout=20)
+        params = {"limit": limit, "offset": offset}
+        if query:
+            params.update(q=query, field=field or "title")
+        resp = get_session().get(url, params=params, timeout=20)
         if resp.ok:
-            return resp.json(), None
-        # Fallback to legacy get_all_tickets endpoint if exposed
-        try:
-            fb = requests.get(f"{API_BASE}/zammad/get_all_tickets", timeout=20)
-            if fb.ok:
-                return fb.json(), None
+            return orjson.loads(resp.content), None
+        # Fallback to legacy get_all_tickets endpoint if exposed (it cannot filter, so not for searches)
+        if not query:
             try:
-                return None, fb.json().get('detail') or fb.text
+                fb = get_session().get(f"{API_BASE}/zammad/get_all_tickets", params=params, timeout=20)
+                if fb.ok:
+                    return orjson.loads(fb.content), None
+                return None, _error_detail(fb)
             except Exception:
-                return None, fb.text
-        except Exception:
-            pass
-        try:
-            return None, resp.json().get('detail') or resp.text
-        except Exception:
-            return None, resp.text
+                pass
+        return None, _error_detail(resp)
     except Exception as e:
         return None, str(e)
 
@@ -132,13 +243,40 @@ def fastapi_zammad_get_ticket(ticket_id: int):
     """Get a single ticket by ID via FastAPI backend."""
     try:
         url = f"{API_BASE}/zammad/tickets/{ticket_id}"
-        resp = requests.get(url, timeout=15)
+        resp = get_session().get(url, timeout=15)
         if resp.ok:
-            return resp.json(), None
-        try:
-            return None, resp.json().get('detail') or resp.text
-        except Exception:
-            return None, resp.text
+            return orjson.loads(resp.content), None
+        return None, _error_detail(resp)
+    except Exception as e:
+        return None, str(e)
+
+def fastapi_zammad_lookups(refresh: bool = False):
+    """Get id -> name maps for states, priorities and groups via FastAPI backend.
+    `refresh` makes the backend re-sweep Zammad instead of serving its cached maps.
+    """
+    try:
+        url = f"{API_BASE}/zammad/lookups"
+        resp = get_session().get(url, params={"refresh": "true"} if refresh else None, timeout=20)
+        if resp.ok:
+            return orjson.loads(resp.content), None
+        return None, _error_detail(resp)
+    except Exception as e:
+        return None, str(e)
+
+def fastapi_zammad_resolve_refs(state_ids=(), priority_ids=(), customer_ids=(), group_ids=()):
+    """Resolve reference IDs of a ticket list to names in one request via FastAPI backend."""
+    try:
+        url = f"{API_BASE}/zammad/refs/resolve"
+        payload = {
+            "state_ids": list(state_ids),
+            "priority_ids": list(priority_ids),
+            "customer_ids": list(customer_ids),
+            "group_ids": list(group_ids),
+        }
+        resp = get_session().post(url, json=payload, timeout=20)
+        if resp.ok:
+            return orjson.loads(resp.content), None
+        return None, _error_detail(resp)
     except Exception as e:
         return None, str(e)
 
@@ -146,13 +284,10 @@ def fastapi_zammad_update_ticket(ticket_id: int, update_data: dict):
     """Update ticket via FastAPI backend."""
     try:
         url = f"{API_BASE}/zammad/tickets/{ticket_id}"
-        resp = requests.patch(url, json=update_data, timeout=20)
+        resp = get_session().patch(url, json=update_data, timeout=20)
         if resp.ok:
-            return resp.json(), None
-        try:
-            return None, resp.json().get('detail') or resp.text
-        except Exception:
-            return None, resp.text
+            return orjson.loads(resp.content), None
+        return None, _error_detail(resp)
     except Exception as e:
         return None, str(e)
 
@@ -160,13 +295,32 @@ def fastapi_zammad_delete_ticket(ticket_id: int):
     """Delete/close ticket via FastAPI backend."""
     try:
         url = f"{API_BASE}/zammad/tickets/{ticket_id}"
-        resp = requests.delete(url, timeout=20)
+        resp = get_session().delete(url, timeout=20)
         if resp.ok:
-            return resp.json() if resp.text else {"success": True}, None
-        try:
-            return None, resp.json().get('detail') or resp.text
-        except Exception:
-            return None, resp.text
+            return orjson.loads(resp.content) if resp.content else {"success": True}, None
+        return None, _error_detail(resp)
+    except Exception as e:
+        return None, str(e)
+
+def fastapi_zammad_bulk_update(ticket_ids: list, update_data: dict):
+    """Apply one update to several tickets via the FastAPI bulk endpoint."""
+    try:
+        url = f"{API_BASE}/zammad/tickets/bulk_update"
+        resp = get_session().post(url, json={"ids": ticket_ids, "update": update_data}, timeout=60)
+        if resp.ok:
+            return orjson.loads(resp.content), None
+        return None, _error_detail(resp)
+    except Exception as e:
+        return None, str(e)
+
+def fastapi_zammad_bulk_delete(ticket_ids: list):
+    """Delete/close several tickets via the FastAPI bulk endpoint."""
+    try:
+        url = f"{API_BASE}/zammad/tickets/bulk_delete"
+        resp = get_session().post(url, json={"ids": ticket_ids}, timeout=60)
+        if resp.ok:
+            return orjson.loads(resp.content), None
+        return None, _error_detail(resp)
     except Exception as e:
         return None, str(e)
 
@@ -174,13 +328,10 @@ def fastapi_zendesk_health():
     """Check Zendesk API health via FastAPI backend."""
     try:
         url = f"{API_BASE}/zendesk/health"
-        resp = requests.get(url, timeout=10)
+        resp = get_session().get(url, timeout=HEALTH_TIMEOUT)
         if resp.ok:
-            return resp.json(), None
-        try:
-            return None, resp.json().get('detail') or resp.text
-        except Exception:
-            return None, resp.text
+            return orjson.loads(resp.content), None
+        return None, _error_detail(resp)
     except Exception as e:
         return None, str(e)
 
@@ -188,84 +339,239 @@ def fastapi_zendesk_create_ticket(ticket_data: dict):
     """Create a ticket in Zendesk via FastAPI backend."""
     try:
         url = f"{API_BASE}/zendesk/tickets"
-        resp = requests.post(url, json=ticket_data, timeout=20)
+        resp = get_session().post(url, json=ticket_data, timeout=20)
         if resp.ok:
-            return resp.json(), None
-        try:
-            return None, resp.json().get('detail') or resp.text
-        except Exception:
-            return None, resp.text
+            return orjson.loads(resp.content), None
+        return None, _error_detail(resp)
     except Exception as e:
         return None, str(e)
 
 ## Removed legacy Zendesk client-based creation helper
 
+class SearchError(RuntimeError):
+    """Backend error raised inside cached searches/listings so failures are not cached."""
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _zammad_ticket_cached(ticket_id):
+    """One ticket by ID, cached per ticket for 60s; None when the backend returns nothing."""
+    data, err = fastapi_zammad_get_ticket(ticket_id)
+    if err:
+        raise SearchError(f"Error fetching ticket: {err}")
+    # The GET endpoint wraps the ticket as {"ticket": {...}}
+    ticket = data.get('ticket', data) if isinstance(data, dict) else None
+    return ticket if isinstance(ticket, dict) and ticket else None
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _search_zammad_tickets_cached(search_type, search_query):
+    """Cached core of `search_zammad_tickets`, keyed by (search_type, search_query) for 60s.
+    Returns `(tickets, truncated)`; `truncated` is set when the backend's fallback sweep skipped older tickets.
+    """
+    if search_type == "Ticket ID":
+        ticket = _zammad_ticket_cached(int(search_query))
+        return ([ticket] if ticket else []), False
+    
+    # Title/email matching happens server-side; only matching tickets come back
+    tickets, err = fastapi_zammad_list_tickets(query=search_query, field=SEARCH_FIELDS[search_type])
+    if err:
+        raise SearchError(f"Error searching tickets: {err}")
+    if not tickets:
+        return [], False
+    truncated = False
+    # Normalize to list
+    if isinstance(tickets, dict) and 'tickets' in tickets:
+        truncated = bool(tickets.get('truncated'))
+        tickets = tickets['tickets']
+    # Type-check once when the cache fills, so readers of the cached results can treat every item as a dict
+    return [t for t in tickets if isinstance(t, dict)], truncated
+
+def current_search_results():
+    """Results of the active search, re-read from the search cache; [] when none is active or it fails."""
+    params = st.session_state.get('search_params')
+    if not params:
+        return []
+    try:
+        return without_deleted(_search_zammad_tickets_cached(*params)[0])
+    except Exception:
+        return []
+
+def search_truncated(params):
+    """True when the search for `params` came from the backend's capped sweep, so older matches may be missing."""
+    if not params:
+        return False
+    try:
+        return _search_zammad_tickets_cached(*params)[1]
+    except Exception:
+        return False
+
+def loaded_ticket_ids(system):
+    """IDs of the tickets currently on screen (active search results and the visible page), read from the caches."""
+    if system != "Zammad":
+        return []
+    tickets = list(current_search_results())
+    if st.session_state.get('show_all_tickets'):
+        try:
+            tickets += without_deleted(_list_zammad_tickets_cached(TICKETS_PAGE_SIZE, st.session_state.get('page_offset', 0)))
+        except Exception:
+            pass
+    return list(dict.fromkeys(t['id'] for t in tickets if t.get('id')))
+
 def search_zammad_tickets(client, search_type, search_query):
     """Search tickets in Zammad via FastAPI.
-    For Ticket ID, calls the ticket GET endpoint. For other searches, lists tickets and filters client-side.
+    For Ticket ID, calls the ticket GET endpoint. For other searches, the backend filters by title or customer email.
+    Results are cached briefly so repeated identical searches skip the API.
     """
     try:
-        if search_type == "Ticket ID":
-            data, err = fastapi_zammad_get_ticket(int(search_query))
-            if err:
-                st.error(f"Error fetching ticket: {err}")
-                return []
-            return [data] if data else []
-        else:
-            tickets, err = fastapi_zammad_list_tickets()
-            if err:
-                st.error(f"Error listing tickets: {err}")
-                return []
-            if not tickets:
-                return []
-            # Normalize to list
-            if isinstance(tickets, dict) and 'tickets' in tickets:
-                tickets = tickets['tickets']
-            results = []
-            q = str(search_query).lower()
-            for t in tickets:
-                try:
-                    if search_type == "Customer Email":
-                        # Try common shapes
-                        email = (
-                            (t.get('customer_email')) if isinstance(t, dict) else None
-                        )
-                        if not email and isinstance(t, dict) and isinstance(t.get('customer'), dict):
-                            email = t['customer'].get('email')
-                        if email and q in str(email).lower():
-                            results.append(t)
-                    elif search_type == "Title":
-                        title = t.get('title') if isinstance(t, dict) else None
-                        if title and q in str(title).lower():
-                            results.append(t)
-                except Exception:
-                    continue
-            return results
+        return without_deleted(_search_zammad_tickets_cached(search_type, str(search_query))[0])
+    except SearchError as e:
+        st.error(str(e))
+        return []
     except Exception as e:
         st.error(f"Error searching Zammad tickets: {str(e)}")
         return []
 
 ## Removed legacy Zendesk search helper (no FastAPI endpoints yet)
 
-def get_all_zammad_tickets(client, limit=50):
-    """Get all tickets from Zammad via FastAPI."""
+def _normalize_ticket_page(response, limit):
+    """Turn a `(data, error)` list response into a list of at most `limit` tickets."""
+    tickets, err = response
+    if err:
+        raise SearchError(f"Error fetching Zammad tickets: {err}")
+    if not tickets:
+        return []
+    if isinstance(tickets, dict) and 'tickets' in tickets:
+        tickets = tickets['tickets']
+    # Limit results and keep only ticket dicts, once per fetch, so readers of the cached page need no per-item type checks
+    return [t for t in islice(tickets, limit) if isinstance(t, dict)]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_zammad_tickets_cached(limit, offset):
+    """Cached page listing, keyed by (limit, offset) for 60s and shared across sessions."""
+    return _normalize_ticket_page(fastapi_zammad_list_tickets(limit=limit, offset=offset), limit)
+
+def get_all_zammad_tickets(client, limit=50, offset=0):
+    """Get one page of tickets from Zammad via FastAPI.
+    The page comes from a 60s cache, so repeated loads skip the API.
+    """
     try:
-        tickets, err = fastapi_zammad_list_tickets()
-        if err:
-            st.error(f"Error fetching Zammad tickets: {err}")
-            return []
-        if not tickets:
-            return []
-        if isinstance(tickets, dict) and 'tickets' in tickets:
-            tickets = tickets['tickets']
-        # Limit results
-        return list(tickets)[:limit]
+        return _list_zammad_tickets_cached(limit, offset)
+    except SearchError as e:
+        st.error(str(e))
+        return []
     except Exception as e:
         st.error(f"Error fetching Zammad tickets: {str(e)}")
         return []
 
 ## Removed legacy Zendesk list helper (no FastAPI endpoints yet)
 
+@st.cache_resource
+def _prefetch_executor():
+    """Process-wide worker pool for background page prefetches, post-write refreshes and lookup jobs."""
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_resource
+def _health_executor():
+    """Dedicated pool for the three health probes, so queued prefetches can't push them past their deadline."""
+    return ThreadPoolExecutor(max_workers=3)
+
+@st.cache_data(ttl=15, show_spinner=False)
+def sidebar_health():
+    """Probe classifier, Zammad and Zendesk health concurrently, so the sidebar waits for the slowest
+    probe rather than their sum. Cached briefly so widget reruns don't re-probe.
+    Returns (classifier_status, (zammad_data, zammad_err), (zendesk_data, zendesk_err)); a probe that
+    raised or missed the shared deadline (one full HEALTH_TIMEOUT) is reported as None.
+    """
+    pool = _health_executor()
+    futures = [
+        pool.submit(check_classifier_health, HEALTH_TIMEOUT),
+        pool.submit(fastapi_zammad_health),
+        pool.submit(fastapi_zendesk_health),
+    ]
+    done, _ = wait(futures, timeout=sum(HEALTH_TIMEOUT))
+    return tuple(
+        future.result() if future in done and future.exception() is None else None
+        for future in futures
+    )
+
+def fetch_ticket_page(system, client, offset=0):
+    """Fetch a single page of tickets for the 'View All Tickets' table.
+    Pages are read from the shared list cache on every rerun, so the session only stores the offset.
+    A full page warms the cache for the next one in the background, so paging forward is usually instant.
+    Returns `(tickets, page_full)`; `page_full` is judged before this session's deleted tickets are
+    dropped, so deleting a row from a full page doesn't look like the last page.
+    """
+    if system != "Zammad":
+        st.info("Zendesk list will be available once FastAPI endpoints are added (list).")
+        return [], False
+    
+    pending = st.session_state.get('ticket_page_prefetch')
+    if pending and pending[0] == offset:
+        # Let the in-flight prefetch land in the cache instead of requesting the page twice
+        try:
+            pending[1].result()
+        except Exception:
+            pass
+    tickets = get_all_zammad_tickets(client, limit=TICKETS_PAGE_SIZE, offset=offset)
+    
+    next_offset = offset + TICKETS_PAGE_SIZE
+    page_full = len(tickets) == TICKETS_PAGE_SIZE
+    if page_full and not (pending and pending[0] == next_offset):
+        warm_ticket_page(next_offset)
+    return without_deleted(tickets), page_full
+
+def _warm_ticket_page_job(offset):
+    """Background job: the page at `offset` and the customer names its table will show, into the shared caches."""
+    tickets = _list_zammad_tickets_cached(TICKETS_PAGE_SIZE, offset)
+    get_zammad_customer_names(tickets)
+    return tickets
+
+def warm_ticket_page(offset):
+    """Start fetching the page at `offset` into the shared cache in the background; fetch_ticket_page waits for it.
+    Its customer names are resolved in the same job, so the next page renders without a further round-trip.
+    """
+    future = _prefetch_executor().submit(_warm_ticket_page_job, offset)
+    st.session_state.ticket_page_prefetch = (offset, future)
+
+def refresh_loaded_tickets(ticket_ids=None):
+    """After a write, drop the cached ticket lists and re-fetch what is on screen in the background,
+    so the refresh overlaps with rendering the result instead of blocking the next rerun.
+    When `ticket_ids` is given only those single-ticket lookups are evicted; the rest stay warm.
+    """
+    if ticket_ids is None:
+        _zammad_ticket_cached.clear()
+    else:
+        for ticket_id in ticket_ids:
+            _zammad_ticket_cached.clear(int(ticket_id))
+    _search_zammad_tickets_cached.clear()
+    _list_zammad_tickets_cached.clear()
+    if st.session_state.get('show_all_tickets'):
+        warm_ticket_page(st.session_state.get('page_offset', 0))
+    else:
+        st.session_state.pop('ticket_page_prefetch', None)
+    if st.session_state.get('search_params'):
+        _prefetch_executor().submit(_search_zammad_tickets_cached, *st.session_state.search_params)
+
+def destroyed_ticket_ids(result, ticket_ids):
+    """IDs a successful delete actually destroyed. Tickets the backend could only close (e.g. a token
+    without admin rights) still exist, so they are not hidden; the refresh shows their new state.
+    """
+    if not isinstance(result, dict):
+        return []
+    if "succeeded" in result:
+        closed = set(result.get("closed", []))
+        return [tid for tid in result["succeeded"] if tid not in closed]
+    return [] if result.get("message") == "Ticket closed" else list(ticket_ids)
+
+def without_deleted(tickets):
+    """Drop tickets this session has destroyed (session_state.deleted_ticket_ids) from a cached list.
+    Covers the gap until the background refresh started after a delete lands in the caches; destroyed
+    tickets never come back, so the IDs can stay in the set.
+    """
+    deleted = st.session_state.get('deleted_ticket_ids')
+    if not deleted:
+        return tickets
+    return [t for t in tickets if t.get('id') not in deleted]
+
 def update_zammad_ticket(client, ticket_id, update_data):
     """Update a ticket in Zammad via FastAPI."""
     try:
@@ -278,6 +584,41 @@ def update_zammad_ticket(client, ticket_id, update_data):
 
 ## Removed legacy Zendesk update helper (no FastAPI endpoints yet)
 
+def parse_ticket_ids(raw):
+    """Parse '42' or '42, 43 57' into a de-duplicated list of ticket IDs. Raises ValueError on bad input."""
+    ids = []
+    for token in str(raw or "").replace(",", " ").split():
+        tid = int(token)
+        if tid < 1:
+            raise ValueError(f"Invalid ticket ID: {token}")
+        ids.append(tid)
+    return list(dict.fromkeys(ids))
+
+def _run_zammad_bulk(send, ticket_ids):
+    """Send `ticket_ids` through `send(chunk)` in chunks of BULK_CHUNK_SIZE and merge the results.
+    Returns (result, error); error is only set when no ticket succeeded.
+    """
+    merged = {"succeeded": [], "failed": {}}
+    for start in range(0, len(ticket_ids), BULK_CHUNK_SIZE):
+        chunk = ticket_ids[start:start + BULK_CHUNK_SIZE]
+        result, err = send(chunk)
+        if err:
+            merged["failed"].update({str(tid): str(err) for tid in chunk})
+            continue
+        merged["succeeded"].extend(result.get("succeeded", []))
+        if "closed" in result:
+            merged.setdefault("closed", []).extend(result["closed"])
+        merged["failed"].update(result.get("failed", {}))
+    if not merged["succeeded"]:
+        return None, "; ".join(f"#{tid}: {msg}" for tid, msg in merged["failed"].items()) or "No tickets updated"
+    return merged, None
+
+def update_zammad_tickets(client, ticket_ids, update_data):
+    """Update one or many Zammad tickets; several IDs go through the bulk endpoint in one request per chunk."""
+    if len(ticket_ids) == 1:
+        return update_zammad_ticket(client, ticket_ids[0], update_data)
+    return _run_zammad_bulk(lambda chunk: fastapi_zammad_bulk_update(chunk, update_data), ticket_ids)
+
 def delete_zammad_ticket(client, ticket_id):
     """Delete/close a ticket in Zammad via FastAPI."""
     try:
@@ -290,92 +631,196 @@ def delete_zammad_ticket(client, ticket_id):
 
 ## Removed legacy Zendesk delete helper (no FastAPI endpoints yet)
 
-def resolve_zammad_ids(client, ticket):
-    """Resolve Zammad ticket IDs to actual names"""
+def delete_zammad_tickets(client, ticket_ids):
+    """Delete/close one or many Zammad tickets; several IDs go through the bulk endpoint."""
+    if len(ticket_ids) == 1:
+        return delete_zammad_ticket(client, ticket_ids[0])
+    return _run_zammad_bulk(fastapi_zammad_bulk_delete, ticket_ids)
+
+def format_ticket_ids(ticket_ids):
+    """'Ticket 42' / 'Tickets 42, 43' for status messages."""
+    label = ", ".join(str(tid) for tid in ticket_ids)
+    return f"Ticket {label}" if len(ticket_ids) == 1 else f"Tickets {label}"
+
+def is_duplicate_submit(action, token):
+    """True when `token` repeats this session's last `action` submit within DUPLICATE_SUBMIT_WINDOW seconds.
+    Records the submit otherwise, so a double-clicked form sends its write only once.
+    """
+    key = f"last_{action}_submit"
+    now = time.monotonic()
+    last = st.session_state.get(key)
+    if last and last[0] == token and now - last[1] < DUPLICATE_SUBMIT_WINDOW:
+        return True
+    st.session_state[key] = (token, now)
+    return False
+
+def forget_submit(action):
+    """Drop the recorded `action` submit after a failed write, so an immediate retry goes through."""
+    st.session_state.pop(f"last_{action}_submit", None)
+
+def show_result_json(result):
+    """Render an API result as indented JSON, encoded with orjson rather than st.json's stdlib encoder.
+    Anything orjson can't encode natively (SDK objects, unexpected types) falls back to str(), so callers need no type check.
+    """
+    st.code(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode(), language="json")
+
+def queue_notice(kind, payload):
+    """Keep a write's outcome for the next full run: successful writes rerun the whole app so every
+    table picks up the refreshed caches, which would otherwise wipe messages shown by the form fragment.
+    `kind` is an st message function name ("success", "warning", ...) or "result" for show_result_json.
+    """
+    st.session_state.setdefault('manage_notices', []).append((kind, payload))
+
+def show_notices():
+    """Render and drop the messages queued by `queue_notice`."""
+    for kind, payload in st.session_state.pop('manage_notices', []):
+        if kind == "result":
+            show_result_json(payload)
+        else:
+            getattr(st, kind)(payload)
+
+@contextmanager
+def action_spinner(text):
+    """Progress message for submit actions, shown right away.
+    st.spinner only renders after 0.5s, so a slow update/delete looked unresponsive for that half second.
+    """
+    placeholder = st.empty()
+    placeholder.caption(f"⏳ {text}")
+    try:
+        yield
+    finally:
+        placeholder.empty()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _zammad_lookup_maps_cached():
+    """Cached core of `get_zammad_lookup_maps`; JSON object keys come back as strings, so re-key by int."""
+    data, err = fastapi_zammad_lookups()
+    if err:
+        raise SearchError(f"Error fetching Zammad lookups: {err}")
+    return {key: {int(k): v for k, v in (names or {}).items()} for key, names in (data or {}).items()}
+
+def refresh_zammad_lookup_maps():
+    """Button callback: re-sweep the reference tables on the backend and drop the shared copy,
+    so every session picks up renamed or new states, priorities and groups on its next rerun.
+    """
+    fastapi_zammad_lookups(refresh=True)
+    _zammad_lookup_maps_cached.clear()
+
+def get_zammad_lookup_maps():
+    """id -> name maps for Zammad states, priorities and groups, fetched once per 5 minutes.
+    Returns {} on failure so tables fall back to showing IDs.
+    """
+    try:
+        return _zammad_lookup_maps_cached()
+    except Exception:
+        return {}
+
+def start_lookups(system):
+    """Fetch the lookup maps in the background when a ticket table is already showing; None otherwise."""
+    if system != "Zammad":
+        return None
+    if not (st.session_state.get('search_params') or st.session_state.get('show_all_tickets')):
+        return None
+    return _prefetch_executor().submit(get_zammad_lookup_maps)
+
+def lookup_maps(system, lookups_job):
+    """Lookup maps for a ticket table: the background job's result (waiting at most LOOKUPS_WAIT seconds),
+    or a direct fetch when no job was started. {} for Zendesk, or when the job is slow or fails.
+    """
+    if system != "Zammad":
+        return {}
+    if lookups_job is None:
+        return get_zammad_lookup_maps()
+    try:
+        return lookups_job.result(timeout=LOOKUPS_WAIT)
+    except Exception:
+        return {}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _zammad_customer_names_cached(customer_ids):
+    """Cached customer-name resolution, keyed by the sorted tuple of distinct customer IDs."""
+    data, err = fastapi_zammad_resolve_refs(customer_ids=customer_ids)
+    if err:
+        raise SearchError(f"Error resolving Zammad customers: {err}")
+    return {int(k): v for k, v in ((data or {}).get('customers') or {}).items()}
+
+def get_zammad_customer_names(tickets):
+    """Customer ID -> name for the distinct customers in `tickets`, in one backend request. {} on failure."""
+    customer_ids = tuple(sorted({
+        t.get('customer_id') for t in tickets if t.get('customer_id')
+    }))
+    if not customer_ids:
+        return {}
+    try:
+        return _zammad_customer_names_cached(customer_ids)
+    except Exception:
+        return {}
+
+def resolve_zammad_ids(lookups, ticket):
+    """Resolve Zammad ticket IDs to names using prefetched `lookups` maps (no API calls)."""
+    raw_get = ticket.get if isinstance(ticket, dict) else (lambda key: getattr(ticket, key, None))
     resolved_data = {}
+    for field, key in ZAMMAD_LOOKUP_KEYS.items():
+        name = (lookups.get(key) or {}).get(raw_get(field))
+        if name:
+            resolved_data[field[:-len('_id')]] = name
+    return resolved_data
+
+_ZAMMAD_ROW_FIELDS = ('id', 'title', 'state_id', 'priority_id', 'customer_id', 'group_id', 'created_at', 'updated_at')
+
+def _display_text(value):
+    return 'N/A' if value is None or value == 'N/A' else str(value)
+
+def _format_zammad_dict(ticket, lookups):
+    """Fast path of `format_ticket_for_display` for Zammad ticket dicts: one map(dict.get) over the fields."""
+    ticket_id, title, state_id, priority_id, customer_id, group_id, created_at, updated_at = map(ticket.get, _ZAMMAD_ROW_FIELDS)
+    lookups = lookups or {}
     
-    try:
-        # Resolve state
-        if 'state_id' in ticket and ticket['state_id']:
-            try:
-                state = client.ticket_state.find(ticket['state_id'])
-                resolved_data['state'] = state.get('name', f"State ID: {ticket['state_id']}")
-            except:
-                resolved_data['state'] = f"State ID: {ticket['state_id']}"
-        
-        # Resolve priority
-        if 'priority_id' in ticket and ticket['priority_id']:
-            try:
-                priority = client.ticket_priority.find(ticket['priority_id'])
-                resolved_data['priority'] = priority.get('name', f"Priority ID: {ticket['priority_id']}")
-            except:
-                resolved_data['priority'] = f"Priority ID: {ticket['priority_id']}"
-        
-        # Resolve customer
-        if 'customer_id' in ticket and ticket['customer_id']:
-            try:
-                customer = client.user.find(ticket['customer_id'])
-                if customer:
-                    name_parts = []
-                    if customer.get('firstname'):
-                        name_parts.append(customer['firstname'])
-                    if customer.get('lastname'):
-                        name_parts.append(customer['lastname'])
-                    if customer.get('email'):
-                        name_parts.append(f"({customer['email']})")
-                    resolved_data['customer'] = ' '.join(name_parts) if name_parts else f"Customer ID: {ticket['customer_id']}"
-                else:
-                    resolved_data['customer'] = f"Customer ID: {ticket['customer_id']}"
-            except:
-                resolved_data['customer'] = f"Customer ID: {ticket['customer_id']}"
-        
-        # Resolve group
-        if 'group_id' in ticket and ticket['group_id']:
-            try:
-                group = client.group.find(ticket['group_id'])
-                resolved_data['group'] = group.get('name', f"Group ID: {ticket['group_id']}")
-            except:
-                resolved_data['group'] = f"Group ID: {ticket['group_id']}"
-                
-    except Exception as e:
-        # If there's any error, just return empty dict and fall back to IDs
-        pass
+    def name(key, value, label):
+        return (lookups.get(key) or {}).get(value) or f"{label}: {_display_text(value)}"
     
-    return resolved_data
+    return {
+        "ID": _display_text(ticket_id),
+        "Title": _display_text(title),
+        "State": name('states', state_id, "State ID"),
+        "Priority": name('priorities', priority_id, "Priority ID"),
+        "Customer": name('customers', customer_id, "Customer ID"),
+        "Group": name('groups', group_id, "Group ID"),
+        "Created": _display_text(created_at),
+        "Updated": _display_text(updated_at)
+    }
 
-def format_ticket_for_display(ticket, system, client=None):
+def format_ticket_for_display(ticket, system, lookups=None):
     """Format ticket data for display in Streamlit"""
     if system == "Zammad":
-        def safe_get(obj, key, default='N/A'):
-            if isinstance(obj, dict):
-                value = obj.get(key, default)
-                return str(value) if value is not None and value != default else default
-            elif hasattr(obj, key):
-                value = getattr(obj, key, default)
-                return str(value) if value is not None and value != default else default
-            else:
-                return default
+        if isinstance(ticket, dict):
+            return _format_zammad_dict(ticket, lookups)
+        
+        # Slow path for SDK-style objects
+        raw_get = lambda key, default: getattr(ticket, key, default)
         
-        # Try to resolve IDs to names if client is provided
-        resolved_data = {}
-        if client:
-            resolved_data = resolve_zammad_ids(client, ticket)
+        def safe_get(key, default='N/A'):
+            value = raw_get(key, default)
+            return str(value) if value is not None and value != default else default
+        
+        # Resolve IDs to names from the prefetched lookup maps
+        resolved_data = resolve_zammad_ids(lookups, ticket) if lookups else {}
         
         # Use resolved data or fall back to IDs
-        state_value = resolved_data.get('state', f"State ID: {safe_get(ticket, 'state_id')}")
-        priority_value = resolved_data.get('priority', f"Priority ID: {safe_get(ticket, 'priority_id')}")
-        customer_value = resolved_data.get('customer', f"Customer ID: {safe_get(ticket, 'customer_id')}")
-        group_value = resolved_data.get('group', f"Group ID: {safe_get(ticket, 'group_id')}")
+        state_value = resolved_data.get('state', f"State ID: {safe_get('state_id')}")
+        priority_value = resolved_data.get('priority', f"Priority ID: {safe_get('priority_id')}")
+        customer_value = resolved_data.get('customer', f"Customer ID: {safe_get('customer_id')}")
+        group_value = resolved_data.get('group', f"Group ID: {safe_get('group_id')}")
         
         return {
-            "ID": safe_get(ticket, 'id'),
-            "Title": safe_get(ticket, 'title'),
+            "ID": safe_get('id'),
+            "Title": safe_get('title'),
             "State": state_value,
             "Priority": priority_value,
             "Customer": customer_value,
             "Group": group_value,
-            "Created": safe_get(ticket, 'created_at'),
-            "Updated": safe_get(ticket, 'updated_at')
+            "Created": safe_get('created_at'),
+            "Updated": safe_get('updated_at')
         }
     else:  # Zendesk
         return {
@@ -389,6 +834,107 @@ def format_ticket_for_display(ticket, system, client=None):
             "Updated": getattr(ticket, 'updated_at', 'N/A')
         }
 
+@st.cache_data(show_spinner=False, ttl=FORMATTED_TICKET_TTL, max_entries=FORMATTED_TICKET_MAX_ENTRIES)
+def _format_ticket_cached(system, ticket_id, updated_at, lookups, _ticket):
+    """Memoized `format_ticket_for_display`.
+    Keyed by (system, ticket_id, updated_at, lookups); `_ticket` is excluded from hashing.
+    """
+    return format_ticket_for_display(_ticket, system, lookups)
+
+def format_ticket_cached(ticket, system, lookups=None):
+    """Format a ticket for display, reusing the cached row for unchanged tickets."""
+    if isinstance(ticket, dict):
+        ticket_id, updated_at = ticket.get('id'), ticket.get('updated_at')
+    else:
+        ticket_id, updated_at = getattr(ticket, 'id', None), getattr(ticket, 'updated_at', None)
+    # Tickets without an id can't be keyed safely
+    if ticket_id is None:
+        return format_ticket_for_display(ticket, system, lookups)
+    return _format_ticket_cached(system, ticket_id, str(updated_at), lookups, ticket)
+
+def paginate_tickets(tickets, key, page_size=TICKETS_PAGE_SIZE):
+    """Return the slice of `tickets` for the page chosen in a 'Page' selector.
+    The selector is only shown when there is more than one page; the page index persists in
+    session_state under `key`.
+    """
+    n_pages = max(1, math.ceil(len(tickets) / page_size))
+    if n_pages == 1:
+        return tickets
+    page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=key)
+    start = (int(page) - 1) * page_size
+    st.caption(f"Page {int(page)} of {n_pages} ({len(tickets)} tickets)")
+    return tickets[start:start + page_size]
+
+def _apply_ticket_dtypes(df):
+    """Give ticket columns Arrow-friendly dtypes so st.dataframe can serialize them column-wise.
+    IDs become nullable integers and timestamps datetimes (unparsable values become empty cells);
+    low-cardinality State/Status/Priority become categories, remaining text pyarrow-backed strings.
+    """
+    for column in ("ID", "Requester ID", "Assignee ID"):
+        if column in df:
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype("Int64")
+    for column in ("Created", "Updated"):
+        if column in df:
+            df[column] = pd.to_datetime(df[column], errors="coerce", utc=True)
+    for column in ("State", "Status", "Priority"):
+        if column in df:
+            df[column] = df[column].astype(str).astype("category")
+    for column in ("Title", "Subject", "Customer", "Group"):
+        if column in df:
+            df[column] = df[column].astype("string[pyarrow]")
+    return df
+
+def tickets_to_df(tickets, system, lookups=None):
+    """Build the display DataFrame for a list of tickets.
+    Zammad ticket dicts are converted column-wise in one DataFrame construction (same values as
+    `format_ticket_for_display`); other shapes go row by row.
+    """
+    if system == "Zammad" and all(isinstance(t, dict) for t in tickets):
+        lookups = lookups or {}
+        fields = [field for field, _, _ in ZAMMAD_DISPLAY_FIELDS]
+        # object dtype keeps integer IDs from being upcast to float when a value is missing
+        df = pd.DataFrame(tickets, columns=fields, dtype=object)
+        resolved = {
+            field: df[field].map(lookups[key])
+            for field, key in ZAMMAD_LOOKUP_KEYS.items() if lookups.get(key)
+        }
+        for field, _, label in ZAMMAD_DISPLAY_FIELDS:
+            # ID/timestamp columns stay raw; _apply_ticket_dtypes parses them straight into typed columns
+            if field in ('id', 'created_at', 'updated_at'):
+                continue
+            text = df[field].where(df[field].notna(), 'N/A').astype(str)
+            if label:
+                text = f"{label}: " + text
+            if field in resolved:
+                text = resolved[field].fillna(text)
+            df[field] = text
+        df.columns = [column for _, column, _ in ZAMMAD_DISPLAY_FIELDS]
+        return _apply_ticket_dtypes(df)
+    # Rows stream straight into the frame in a fixed column order, without an intermediate list
+    rows = (format_ticket_cached(t, system, lookups) for t in tickets)
+    return _apply_ticket_dtypes(pd.DataFrame.from_records(rows, columns=TICKET_DISPLAY_COLUMNS[system]))
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_ticket_df(system, fingerprint, lookups, _tickets):
+    """Memoized `tickets_to_df`, keyed by the (id, updated_at) fingerprint of the list and the lookup maps."""
+    return tickets_to_df(_tickets, system, lookups)
+
+def render_ticket_table(tickets, system, lookups=None):
+    """Format `tickets` and render them as a dataframe. Returns the DataFrame (empty if nothing to show).
+    Unchanged ticket lists reuse the cached DataFrame, so reruns that don't touch the data skip the build.
+    """
+    if system == "Zammad" and lookups is not None:
+        # Customers are resolved per table: only the distinct IDs being shown, in one request
+        lookups = {**lookups, 'customers': get_zammad_customer_names(tickets)}
+    if all(isinstance(t, dict) for t in tickets):
+        fingerprint = tuple((t.get('id'), t.get('updated_at')) for t in tickets)
+        df = _build_ticket_df(system, fingerprint, lookups, tickets)
+    else:
+        df = tickets_to_df(tickets, system, lookups)
+    if not df.empty:
+        st.dataframe(df, column_config=TICKET_COLUMN_CONFIG[system], use_container_width=True, hide_index=True)
+    return df
+
 def main():
     # Header
     st.markdown('<h1 class="main-header">🎫 RouteIQ Ticket Management System</h1>', unsafe_allow_html=True)
@@ -400,14 +946,16 @@ with st.sidebar:
     # System selection
     system = st.selectbox(
         "Select Ticketing System",
-        ["Zammad", "Zendesk"],
+        TICKET_SYSTEMS,
         help="Choose which ticketing system to use"
     )
     
-    # Service health (FastAPI-backed)
+    # Service health (FastAPI-backed), probed concurrently
+    classifier_status, zammad_status, zendesk_status = sidebar_health()
+    
     # Classifier health
     try:
-        health_status = check_classifier_health()
+        health_status = classifier_status
         if health_status.get("status") == "healthy":
             st.success(f"✅ Classifier: Online (v{health_status.get('version', 'unknown')})")
         else:
@@ -415,15 +963,19 @@ with st.sidebar:
     except Exception:
         st.warning("⚠️ Classifier: Unavailable")
     
+    # Zammad/Zendesk API health; tabs that need a backend skip their widgets when it is down
+    backend_online = {"Zammad": False, "Zendesk": False}
+    
     # Zammad API health
     try:
-        z_health, z_err = fastapi_zammad_health()
+        z_health, z_err = zammad_status
         if z_err:
             st.warning(f"⚠️ Zammad API: {z_err}")
         else:
             status = z_health.get('status') or z_health.get('message') or 'unknown'
             if str(status).lower() in ("ok", "healthy", "online"):
                 st.success("✅ Zammad API: Online")
+                backend_online["Zammad"] = True
             else:
                 st.warning(f"⚠️ Zammad API: {status}")
     except Exception:
@@ -431,18 +983,25 @@ with st.sidebar:
     
     # Zendesk API health
     try:
-        zd_health, zd_err = fastapi_zendesk_health()
+        zd_health, zd_err = zendesk_status
         if zd_err:
             st.warning(f"⚠️ Zendesk API: {zd_err}")
         else:
             status = zd_health.get('status') or zd_health.get('message') or 'unknown'
             if str(status).lower() in ("ok", "healthy", "online"):
                 st.success("✅ Zendesk API: Online")
+                backend_online["Zendesk"] = True
             else:
                 st.warning(f"⚠️ Zendesk API: {status}")
     except Exception:
         st.warning("⚠️ Zendesk API: Unavailable")
     
+    # Health is cached for 15s; the callback drops it so this rerun probes again
+    st.button("🔄 Refresh health", on_click=sidebar_health.clear)
+    if system == "Zammad":
+        # Reference data is cached process-wide for 5 minutes; this pulls changes in right away
+        st.button("🔄 Refresh reference data", on_click=refresh_zammad_lookup_maps)
+    
     # Environment variables check
     st.subheader("🔐 Environment Variables")
     env_vars = {
@@ -450,8 +1009,9 @@ with st.sidebar:
         "Zendesk": ["ZENDESK_EMAIL", "ZENDESK_TOKEN", "ZENDESK_SUBDOMAIN"]
     }
     
+    env = env_snapshot()
     for var in env_vars[system]:
-        if os.getenv(var):
+        if env[var]:
             st.success(f"✅ {var}")
         else:
             st.error(f"❌ {var}")
@@ -459,9 +1019,14 @@ with st.sidebar:
 # Main content area
 tab1, tab2, tab3, tab4 = st.tabs(["📝 Create Ticket", "📊 Ticket History", "🔍 Search & Manage", "⚙️ Settings"])
 
-with tab1:
+def render_create_tab(system):
+    """Render the 'Create Ticket' tab; skips the form when the selected backend is down."""
     st.markdown('<h2 class="section-header">Create New Ticket</h2>', unsafe_allow_html=True)
     
+    if not backend_online[system]:
+        st.warning(f"⚠️ {system} API is unavailable. Start the FastAPI backend and check credentials to create tickets.")
+        return
+    
     # No client initialization required; FastAPI is used for all operations
     # Create ticket form
     with st.form("create_ticket_form"):
@@ -483,8 +1048,7 @@ with tab1:
             
             if system == "Zammad":
                 # Static options; actual routing/creation handled by FastAPI backend
-                group_options = ["Auto (Use AI)", "Users"]
-                group = st.selectbox("Group/Department", group_options)
+                group = st.selectbox("Group/Department", ZAMMAD_GROUP_OPTIONS)
                 
                 # Step 1: Show instructions before classification and naming convention guidance
                 st.info("Please create the dept/group what they want and if dept/group is already there, give all the permissions as an admin/agent.")
@@ -508,7 +1072,8 @@ with tab1:
             # Validate required fields
             if not title or not description or not customer_email:
                 st.error("❌ Please fill in all required fields (marked with *)")
-                
+                # Nothing to send; return rather than st.stop() so the other tabs still render
+                return
             
             # Prepare ticket data
             ticket_data = {
@@ -540,6 +1105,12 @@ with tab1:
             else:
                 st.success("✅ Ticket created successfully!")
                 
+                # Cached pages/searches predate the new ticket
+                if system == "Zammad":
+                    refresh_loaded_tickets()
+                    if isinstance(result, dict) and result.get("new_group_created"):
+                        _zammad_lookup_maps_cached.clear()
+                
                 # If using auto-group, surface instructions/warnings
                 if system == "Zammad" and isinstance(result, dict):
                     assigned_group = result.get("assigned_group") or result.get("group")
@@ -550,16 +1121,7 @@ with tab1:
                         st.info("🔔 A new department/group was created automatically.")
                         # Display admin permission instructions
                         group_to_grant = created_group_name or assigned_group or "<new group>"
-                        st.warning(
-                            "\n".join([
-                                "ACTION REQUIRED: Grant permissions for the new department/group",
-                                "1. Go to Admin > Roles",
-                                "2. Edit the appropriate role for the API user",
-                                f"3. Under 'Group Permissions', set '{group_to_grant}' to 'Full'",
-                                "4. Save changes",
-                                "Once granted, future tickets will be created directly in this group without fallback."
-                            ])
-                        )
+                        st.warning(GRANT_PERMISSIONS_STEPS.format(kind="new", group=group_to_grant))
                     if result.get("permission_warning") or result.get("fallback_group_used"):
                         fallback_group = result.get("fallback_group")
                         warn_txt = "Permissions missing for the intended group. "
@@ -568,16 +1130,7 @@ with tab1:
                         st.warning(warn_txt)
                         # Provide admin steps even when we fell back (not only when a group was newly created)
                         group_to_grant = result.get("created_group_name") or result.get("assigned_group") or result.get("resolved_group") or result.get("group") or "<group>"
-                        st.info(
-                            "\n".join([
-                                "ACTION REQUIRED: Grant permissions for the intended department/group",
-                                "1. Go to Admin > Roles",
-                                "2. Edit the appropriate role for the API user",
-                                f"3. Under 'Group Permissions', set '{group_to_grant}' to 'Full'",
-                                "4. Save changes",
-                                "Once granted, future tickets will be created directly in this group without fallback."
-                            ])
-                        )
+                        st.info(GRANT_PERMISSIONS_STEPS.format(kind="intended", group=group_to_grant))
                 
                 # Add to history
                 ticket_record = {
@@ -590,48 +1143,80 @@ with tab1:
                 st.session_state.ticket_history.append(ticket_record)
                 
                 # Show ticket details
-                st.json(result if isinstance(result, dict) else str(result))
+                show_result_json(result)
+
+# Button callbacks: they run before the rerun the click already triggers, so no st.rerun() is needed
+def clear_history():
+    st.session_state.ticket_history = deque(maxlen=TICKET_HISTORY_MAX)
+
+def clear_search_results():
+    st.session_state.search_params = None
+
+def show_ticket_page(offset):
+    st.session_state.page_offset = offset
+
+def clear_all_tickets():
+    st.session_state.update(show_all_tickets=False, page_offset=0)
+    st.session_state.pop('ticket_page_prefetch', None)
+
+def hide_update_form():
+    st.session_state.show_update_form = False
+
+def hide_delete_form():
+    st.session_state.show_delete_form = False
+
+with tab1:
+    render_create_tab(system)
 
 with tab2:
     st.markdown('<h2 class="section-header">Ticket History</h2>', unsafe_allow_html=True)
     
     if st.session_state.ticket_history:
         # Display tickets in a table
-        import pandas as pd
-        df = pd.DataFrame(st.session_state.ticket_history)
+        df = pd.DataFrame.from_records(st.session_state.ticket_history, columns=HISTORY_COLUMNS)
         st.dataframe(df, use_container_width=True)
         
         # Clear history button
-        if st.button("🗑️ Clear History"):
-            st.session_state.ticket_history = []
-            st.rerun()
+        st.button("🗑️ Clear History", on_click=clear_history)
     else:
         st.info("📝 No tickets created yet. Create your first ticket in the 'Create Ticket' tab.")
 
-with tab3:
+def render_manage_tab(system):
+    """Render the 'Search & Manage' tab; skips all widgets when the selected backend is down."""
     st.markdown('<h2 class="section-header">Search & Manage Tickets</h2>', unsafe_allow_html=True)
     
+    if not backend_online[system]:
+        st.warning(f"⚠️ {system} API is unavailable. Start the FastAPI backend and check credentials to search or manage tickets.")
+        return
+    
     # FastAPI-only: no SDK clients required
     client = None
+    # Names for state/priority/group IDs, fetched in one call and shared by every table below.
+    # Started in the background only when a table is showing, so it overlaps the ticket fetch;
+    # a table opened by this run's search or "View All" click fetches the maps itself.
+    lookups_job = start_lookups(system)
     
-    # Search functionality
+    # Search functionality (inside a form so typing/selecting doesn't rerun the script)
     st.subheader("🔍 Search Tickets")
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        search_type = st.selectbox("Search by", ["Ticket ID", "Customer Email", "Title"])
-        search_query = st.text_input("Search Query")
-    
-    with col2:
-        st.write("")
-        st.write("")
-        search_clicked = st.button("🔍 Search", type="primary")
+    with st.form("search_form"):
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            search_type = st.selectbox("Search by", SEARCH_TYPES)
+            search_query = st.text_input("Search Query")
+        
+        with col2:
+            st.write("")
+            st.write("")
+            search_clicked = st.form_submit_button("🔍 Search", type="primary")
     
-    # Initialize session state for search results
-    if 'search_results' not in st.session_state:
-        st.session_state.search_results = []
-    if 'all_tickets' not in st.session_state:
-        st.session_state.all_tickets = []
+    # Ticket lists live in the shared caches; the session only remembers what to show
+    if 'search_params' not in st.session_state:
+        st.session_state.search_params = None
+    if 'show_all_tickets' not in st.session_state:
+        st.session_state.show_all_tickets = False
+    if 'page_offset' not in st.session_state:
+        st.session_state.page_offset = 0
     
     # Search functionality
     if search_clicked:
@@ -643,33 +1228,22 @@ with tab3:
                     st.info("Zendesk search will be available once FastAPI endpoints are added (get/list/search).")
                     results = []
                 
-                st.session_state.search_results = results
+                st.session_state.update(
+                    search_params=(search_type, str(search_query)) if results else None,
+                    search_results_page=1,
+                )
                 
                 if results:
                     st.success(f"✅ Found {len(results)} ticket(s)")
                 else:
                     st.info("📝 No tickets found matching your search criteria")
+                    if system == "Zammad" and search_truncated((search_type, str(search_query))):
+                        st.caption(f"⚠️ {SEARCH_TRUNCATED_NOTE}")
         else:
             st.warning("Please enter a search query")
     
-    # Display search results
-    if st.session_state.search_results:
-        st.subheader("🎫 Search Results")
-        
-        # Convert tickets to display format
-        display_data = []
-        for ticket in st.session_state.search_results:
-            display_data.append(format_ticket_for_display(ticket, system, client))
-        
-        if display_data:
-            import pandas as pd
-            df = pd.DataFrame(display_data)
-            st.dataframe(df, use_container_width=True)
-            
-            # Clear search results
-            if st.button("🗑️ Clear Search Results"):
-                st.session_state.search_results = []
-                st.rerun()
+    # Result tables are fragments: paging or clearing them reruns only the table, not the whole tab
+    render_search_results(system, lookups_job)
     
     st.divider()
     
@@ -686,13 +1260,9 @@ with tab3:
     with col1:
         if st.button("📊 View All Tickets", type="secondary"):
             with st.spinner(f"Fetching all {system} tickets..."):
-                if system == "Zammad":
-                    tickets = get_all_zammad_tickets(client)
-                else:
-                    st.info("Zendesk list will be available once FastAPI endpoints are added (list).")
-                    tickets = []
+                tickets, _ = fetch_ticket_page(system, client, offset=0)
                 
-                st.session_state.all_tickets = tickets
+                st.session_state.update(show_all_tickets=bool(tickets), page_offset=0)
                 
                 if tickets:
                     st.success(f"✅ Loaded {len(tickets)} ticket(s)")
@@ -701,201 +1271,278 @@ with tab3:
     
     with col2:
         if st.button("✏️ Update Ticket", type="secondary"):
-            st.session_state.show_update_form = not st.session_state.show_update_form
-            st.session_state.show_delete_form = False  # Hide delete form
+            # Only one of the update/delete forms is open at a time
+            st.session_state.update(show_update_form=not st.session_state.show_update_form, show_delete_form=False)
     
     with col3:
         if st.button("🗑️ Delete Ticket", type="secondary"):
-            st.session_state.show_delete_form = not st.session_state.show_delete_form
-            st.session_state.show_update_form = False  # Hide update form
+            st.session_state.update(show_delete_form=not st.session_state.show_delete_form, show_update_form=False)
+    
+    render_all_tickets(system, client, lookups_job)
+    
+    # Outcome of the last successful update/delete, which reran the app to refresh the tables
+    show_notices()
+    
+    # The update/delete forms are fragments, so submitting or cancelling them reruns only the form
+    # (a successful write reruns the whole app)
+    render_update_form(system, client)
+    render_delete_form(system, client)
+
+@st.fragment
+def render_search_results(system, lookups_job):
+    """Search results table for the 'Search & Manage' tab, re-read from the search cache
+    (expired entries are fetched again). Only the visible page of results is formatted.
+    """
+    search_results = current_search_results() if system == "Zammad" else []
+    if not search_results:
+        return
+    st.subheader("🎫 Search Results")
+    
+    if search_truncated(st.session_state.get('search_params')):
+        st.caption(f"⚠️ {SEARCH_TRUNCATED_NOTE}")
+    
+    page_tickets = paginate_tickets(search_results, key="search_results_page")
+    df = render_ticket_table(page_tickets, system, lookup_maps(system, lookups_job))
+    
+    if not df.empty:
+        st.button("🗑️ Clear Search Results", on_click=clear_search_results)
+
+@st.fragment
+def render_all_tickets(system, client, lookups_job):
+    """'All Tickets' table for the 'Search & Manage' tab, shown while show_all_tickets is set."""
+    if not st.session_state.get('show_all_tickets'):
+        return
+    st.subheader("📊 All Tickets")
+    
+    # Only one page of tickets is fetched at a time, straight from the shared cache
+    offset = st.session_state.page_offset
+    with st.spinner(f"Fetching {system} tickets..."):
+        tickets, page_full = fetch_ticket_page(system, client, offset=offset)
+    df = render_ticket_table(tickets, system, lookup_maps(system, lookups_job))
+    
+    if df.empty:
+        st.info("📝 No more tickets" if offset else "📝 No tickets found")
+    else:
+        st.caption(f"Showing tickets {offset + 1}–{offset + len(df)}")
+    
+    # Page navigation
+    prev_col, next_col = st.columns([1, 1])
+    with prev_col:
+        st.button("⬅️ Previous Page", disabled=offset == 0,
+                  on_click=show_ticket_page, args=(max(0, offset - TICKETS_PAGE_SIZE),))
+    with next_col:
+        st.button("Next Page ➡️", disabled=not page_full,
+                  on_click=show_ticket_page, args=(offset + TICKETS_PAGE_SIZE,))
+    
+    # Clear all tickets
+    st.button("🗑️ Clear All Tickets View", on_click=clear_all_tickets)
+
+@st.fragment
+def render_update_form(system, client):
+    """Update form for the 'Search & Manage' tab, shown while show_update_form is set."""
+    if not st.session_state.get('show_update_form'):
+        return
+    st.divider()
+    st.subheader("✏️ Update Ticket")
     
-    # Display all tickets
-    if st.session_state.all_tickets:
-        st.subheader("📊 All Tickets")
+    with st.form("update_ticket_form"):
+        picked_ids = st.multiselect("Tickets from the results above", loaded_ticket_ids(system), key="update_ticket_pick")
+        ticket_ids_raw = st.text_input("Ticket ID(s)", placeholder="e.g. 42 or 42, 43, 57", key="update_ticket_ids")
         
-        # Convert tickets to display format
-        display_data = []
-        for ticket in st.session_state.all_tickets:
-            display_data.append(format_ticket_for_display(ticket, system, client))
+        if system == "Zammad":
+            st.text_input("New Title (optional)", key="update_title")
+            st.selectbox("New State (optional)", ZAMMAD_STATES, key="update_state")
+            st.selectbox("New Priority (optional)", ZAMMAD_PRIORITIES, key="update_priority")
+        else:  # Zendesk
+            st.text_input("New Subject (optional)", key="update_subject")
+            st.selectbox("New Status (optional)", ZENDESK_STATUSES, key="update_status")
+            st.selectbox("New Priority (optional)", ZENDESK_PRIORITIES, key="update_priority_zd")
         
-        if display_data:
-            import pandas as pd
-            df = pd.DataFrame(display_data)
-            st.dataframe(df, use_container_width=True)
-            
-            # Clear all tickets
-            if st.button("🗑️ Clear All Tickets View"):
-                st.session_state.all_tickets = []
-                st.rerun()
-    
-    # Update ticket functionality
-    if st.session_state.show_update_form:
-        st.divider()
-        st.subheader("✏️ Update Ticket")
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            update_submitted = st.form_submit_button("🔄 Update Ticket", type="primary")
+        with col2:
+            st.form_submit_button("❌ Cancel", on_click=hide_update_form)
         
-        with st.form("update_ticket_form"):
-            ticket_id = st.number_input("Ticket ID", min_value=1, step=1, key="update_ticket_id")
-            
-            if system == "Zammad":
-                update_title = st.text_input("New Title (optional)", key="update_title")
-                update_state = st.selectbox("New State (optional)", ["", "new", "open", "pending reminder", "pending close", "closed"], key="update_state")
-                update_priority = st.selectbox("New Priority (optional)", ["", "1 low", "2 normal", "3 high"], key="update_priority")
-            else:  # Zendesk
-                update_subject = st.text_input("New Subject (optional)", key="update_subject")
-                update_status = st.selectbox("New Status (optional)", ["", "new", "open", "pending", "hold", "solved", "closed"], key="update_status")
-                update_priority = st.selectbox("New Priority (optional)", ["", "low", "normal", "high", "urgent"], key="update_priority_zd")
-            
-            col1, col2 = st.columns([1, 1])
-            with col1:
-                update_submitted = st.form_submit_button("🔄 Update Ticket", type="primary")
-            with col2:
-                cancel_update = st.form_submit_button("❌ Cancel")
-            
-            if cancel_update:
-                st.session_state.show_update_form = False
-                st.rerun()
+        if update_submitted:
+            if system != "Zammad":
+                st.info("Zendesk update will be available once FastAPI endpoints are added (update).")
+                return
+            try:
+                # Picked and typed IDs are updated together in one bulk request
+                ticket_ids = list(dict.fromkeys(picked_ids + parse_ticket_ids(ticket_ids_raw)))
+            except ValueError:
+                ticket_ids = []
+            # Only send the fields the user actually filled in; form widgets hold their values under their keys
+            update_data = {name: st.session_state[key] for name, key in UPDATE_FORM_FIELDS[system] if st.session_state.get(key)}
             
-            if update_submitted:
-                if ticket_id:
-                    # Prepare update data
-                    update_data = {}
-                    
-                    if system == "Zammad":
-                        if update_title:
-                            update_data['title'] = update_title
-                        if update_state:
-                            update_data['state'] = update_state
-                        if update_priority:
-                            update_data['priority'] = update_priority
-                    else:  # Zendesk
-                        if update_subject:
-                            update_data['subject'] = update_subject
-                        if update_status:
-                            update_data['status'] = update_status
-                        if update_priority:
-                            update_data['priority'] = update_priority
+            # Reject empty submissions before any spinner or API call
+            if not ticket_ids:
+                st.warning("Please enter valid ticket ID(s)")
+            elif not update_data:
+                st.warning("Please provide at least one field to update")
+            elif is_duplicate_submit("update", (tuple(ticket_ids), tuple(sorted(update_data.items())))):
+                st.info("This update was just submitted; ignoring the repeat.")
+            else:
+                ids_label = format_ticket_ids(ticket_ids)
+                with action_spinner(f"Updating {ids_label}..."):
+                    result, error = update_zammad_tickets(client, ticket_ids, update_data)
                     
-                    if update_data:
-                        with st.spinner(f"Updating ticket {ticket_id}..."):
-                            if system == "Zammad":
-                                result, error = update_zammad_ticket(client, ticket_id, update_data)
-                            else:
-                                st.info("Zendesk update will be available once FastAPI endpoints are added (update).")
-                                result, error = None, None
-                            
-                            if error:
-                                st.error(f"❌ Failed to update ticket: {error}")
-                            else:
-                                st.success(f"✅ Ticket {ticket_id} updated successfully!")
-                                if isinstance(result, dict):
-                                    st.json(result)
-                                else:
-                                    st.write(f"Result: {str(result)}")
-                                # Hide form after successful update
-                                st.session_state.show_update_form = False
+                    if error:
+                        st.error(f"❌ Failed to update ticket: {error}")
+                        forget_submit("update")
                     else:
-                        st.warning("Please provide at least one field to update")
-                else:
-                    st.warning("Please enter a valid ticket ID")
+                        done_ids = result.get("succeeded", ticket_ids) if isinstance(result, dict) else ticket_ids
+                        queue_notice("success", f"✅ {format_ticket_ids(done_ids)} updated successfully!")
+                        if isinstance(result, dict) and result.get("failed"):
+                            queue_notice("warning", f"⚠️ Some tickets could not be updated: {result['failed']}")
+                        queue_notice("result", result)
+                        # Cached searches/pages may hold the pre-update ticket
+                        refresh_loaded_tickets(ticket_ids)
+                        # Hide the form and rerun the whole app, so the table fragments show the updated rows
+                        st.session_state.show_update_form = False
+                        st.rerun(scope="app")
+
+@st.fragment
+def render_delete_form(system, client):
+    """Delete form for the 'Search & Manage' tab, shown while show_delete_form is set."""
+    if not st.session_state.get('show_delete_form'):
+        return
+    st.divider()
+    st.subheader("🗑️ Delete Ticket")
     
-    # Delete ticket functionality
-    if st.session_state.show_delete_form:
-        st.divider()
-        st.subheader("🗑️ Delete Ticket")
-        
-        st.warning("⚠️ **Warning:** This action cannot be undone!")
+    st.warning("⚠️ **Warning:** This action cannot be undone!")
+    
+    if system == "Zammad":
+        st.info("📝 **Note:** Zammad tickets will be closed instead of permanently deleted.")
+    elif system == "Zendesk":
+        st.info("📝 **Note:** Zendesk tickets will be closed and marked as deleted (soft delete).")
+    
+    with st.form("delete_ticket_form"):
+        delete_ids_raw = st.text_input("Ticket ID(s) to Delete", placeholder="e.g. 42 or 42, 43, 57", key="delete_ticket_ids")
+        confirm_delete = st.checkbox("I confirm that I want to delete this ticket", key="confirm_delete")
         
-        if system == "Zammad":
-            st.info("📝 **Note:** Zammad tickets will be closed instead of permanently deleted.")
-        elif system == "Zendesk":
-            st.info("📝 **Note:** Zendesk tickets will be closed and marked as deleted (soft delete).")
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            delete_submitted = st.form_submit_button("🗑️ Delete Ticket", type="primary")
+        with col2:
+            st.form_submit_button("❌ Cancel", on_click=hide_delete_form)
         
-        with st.form("delete_ticket_form"):
-            delete_ticket_id = st.number_input("Ticket ID to Delete", min_value=1, step=1, key="delete_ticket_id")
-            confirm_delete = st.checkbox("I confirm that I want to delete this ticket", key="confirm_delete")
-            
-            col1, col2 = st.columns([1, 1])
-            with col1:
-                delete_submitted = st.form_submit_button("🗑️ Delete Ticket", type="primary")
-            with col2:
-                cancel_delete = st.form_submit_button("❌ Cancel")
-            
-            if cancel_delete:
-                st.session_state.show_delete_form = False
-                st.rerun()
-            
-            if delete_submitted:
-                if delete_ticket_id and confirm_delete:
-                    with st.spinner(f"Deleting ticket {delete_ticket_id}..."):
-                        if system == "Zammad":
-                            result, error = delete_zammad_ticket(client, delete_ticket_id)
-                        else:
-                            st.info("Zendesk delete will be available once FastAPI endpoints are added (delete/close).")
-                            result, error = None, None
-                        
-                        if error:
-                            st.error(f"❌ Failed to delete ticket: {error}")
-                        else:
-                            st.success(f"✅ Ticket {delete_ticket_id} deleted successfully!")
-                            # Clear any cached results that might contain the deleted ticket
-                            if 'search_results' in st.session_state:
-                                st.session_state.search_results = []
-                            if 'all_tickets' in st.session_state:
-                                st.session_state.all_tickets = []
-                            # Hide form after successful deletion
-                            st.session_state.show_delete_form = False
-                elif not confirm_delete:
-                    st.warning("Please confirm that you want to delete the ticket")
-                else:
-                    st.warning("Please enter a valid ticket ID")
+        if delete_submitted:
+            if system != "Zammad":
+                st.info("Zendesk delete will be available once FastAPI endpoints are added (delete/close).")
+                return
+            try:
+                delete_ticket_ids = parse_ticket_ids(delete_ids_raw)
+            except ValueError:
+                delete_ticket_ids = []
+            if delete_ticket_ids and confirm_delete and is_duplicate_submit("delete", tuple(delete_ticket_ids)):
+                st.info("This delete was just submitted; ignoring the repeat.")
+            elif delete_ticket_ids and confirm_delete:
+                ids_label = format_ticket_ids(delete_ticket_ids)
+                with action_spinner(f"Deleting {ids_label}..."):
+                    result, error = delete_zammad_tickets(client, delete_ticket_ids)
+                    
+                    if error:
+                        st.error(f"❌ Failed to delete ticket: {error}")
+                        forget_submit("delete")
+                    else:
+                        deleted_ids = result.get("succeeded", delete_ticket_ids) if isinstance(result, dict) else delete_ticket_ids
+                        queue_notice("success", f"✅ {format_ticket_ids(deleted_ids)} deleted successfully!")
+                        if isinstance(result, dict) and result.get("failed"):
+                            queue_notice("warning", f"⚠️ Some tickets could not be deleted: {result['failed']}")
+                        # Hide the destroyed tickets from the cached lists and close the form in one state update
+                        st.session_state.update(
+                            deleted_ticket_ids=st.session_state.get('deleted_ticket_ids', set())
+                            | set(destroyed_ticket_ids(result, delete_ticket_ids)),
+                            show_delete_form=False,
+                        )
+                        # Re-fetch the shared lists in the background so other sessions
+                        # drop the rows too; this session already hides them, so nothing waits on it
+                        refresh_loaded_tickets(delete_ticket_ids)
+                        # Rerun the whole app, so the table fragments drop the deleted rows
+                        st.rerun(scope="app")
+            elif not confirm_delete:
+                st.warning("Please confirm that you want to delete the ticket")
+            else:
+                st.warning("Please enter valid ticket ID(s)")
 
-with tab4:
+with tab3:
+    render_manage_tab(system)
+
+def open_settings():
+    """Button callback: mark the Settings tab as opened for this session."""
+    st.session_state.settings_opened = True
+
+def close_settings():
+    """Button callback: stop building the Settings widgets again until reopened."""
+    st.session_state.settings_opened = False
+
+def reload_env():
+    """Button callback: re-read .env over the process environment and drop the cached snapshot,
+    so edits show up in the sidebar check and Settings without waiting out env_snapshot's ttl.
+    """
+    load_dotenv(override=True)
+    env_snapshot.clear()
+
+def render_settings_tab():
+    """Render the 'Settings' tab. Its widgets are only built once the user opens it."""
     st.markdown('<h2 class="section-header">Settings</h2>', unsafe_allow_html=True)
     
-    # Environment variables configuration
-    st.subheader("🔐 Environment Variables")
+    if not st.session_state.get('settings_opened'):
+        st.button("⚙️ Open Settings", on_click=open_settings)
+        return
     
-    with st.expander("Zammad Configuration"):
-        zammad_url = st.text_input("ZAMMAD_URL", value=os.getenv('ZAMMAD_URL', ''))
-        zammad_token = st.text_input("ZAMMAD_HTTP_TOKEN", value=os.getenv('ZAMMAD_HTTP_TOKEN', ''), type="password")
-        zammad_username = st.text_input("ZAMMAD_USERNAME", value=os.getenv('ZAMMAD_USERNAME', ''))
-        zammad_password = st.text_input("ZAMMAD_PASSWORD", value=os.getenv('ZAMMAD_PASSWORD', ''), type="password")
+    env = env_snapshot()
     
-    with st.expander("Zendesk Configuration"):
-        zendesk_email = st.text_input("ZENDESK_EMAIL", value=os.getenv('ZENDESK_EMAIL', ''))
-        zendesk_token = st.text_input("ZENDESK_TOKEN", value=os.getenv('ZENDESK_TOKEN', ''), type="password")
-        zendesk_subdomain = st.text_input("ZENDESK_SUBDOMAIN", value=os.getenv('ZENDESK_SUBDOMAIN', ''))
-    
-    # FastAPI Classifier Configuration section removed
-    
-    # Application settings
-    st.subheader("⚙️ Application Settings")
-    
-    # Theme selection
-    theme = st.selectbox("Theme", ["Light", "Dark"], index=0)
-    
-    # Auto-refresh settings
-    auto_refresh = st.checkbox("Auto-refresh ticket list", value=False)
-    if auto_refresh:
-        refresh_interval = st.slider("Refresh interval (seconds)", 10, 300, 60)
-    
-    # Notification settings
-    st.subheader("🔔 Notifications")
-    email_notifications = st.checkbox("Email notifications", value=True)
-    desktop_notifications = st.checkbox("Desktop notifications", value=False)
+    # One form for all settings: editing fields doesn't rerun the app, only Save does
+    with st.form("settings_form"):
+        # Environment variables configuration
+        st.subheader("🔐 Environment Variables")
+        
+        with st.expander("Zammad Configuration"):
+            zammad_url = st.text_input("ZAMMAD_URL", value=env["ZAMMAD_URL"])
+            zammad_token = st.text_input("ZAMMAD_HTTP_TOKEN", value=env["ZAMMAD_HTTP_TOKEN"], type="password")
+            zammad_username = st.text_input("ZAMMAD_USERNAME", value=env["ZAMMAD_USERNAME"])
+            zammad_password = st.text_input("ZAMMAD_PASSWORD", value=env["ZAMMAD_PASSWORD"], type="password")
+        
+        with st.expander("Zendesk Configuration"):
+            zendesk_email = st.text_input("ZENDESK_EMAIL", value=env["ZENDESK_EMAIL"])
+            zendesk_token = st.text_input("ZENDESK_TOKEN", value=env["ZENDESK_TOKEN"], type="password")
+            zendesk_subdomain = st.text_input("ZENDESK_SUBDOMAIN", value=env["ZENDESK_SUBDOMAIN"])
+        
+        # FastAPI Classifier Configuration section removed
+        
+        # Application settings
+        st.subheader("⚙️ Application Settings")
+        
+        # Theme selection
+        theme = st.selectbox("Theme", THEMES, index=0)
+        
+        # Auto-refresh settings (widgets inside a form can't appear conditionally, so the interval is always shown)
+        auto_refresh = st.checkbox("Auto-refresh ticket list", value=False)
+        refresh_interval = st.slider("Refresh interval (seconds)", 10, 300, 60, help="Used when auto-refresh is enabled")
+        
+        # Notification settings
+        st.subheader("🔔 Notifications")
+        email_notifications = st.checkbox("Email notifications", value=True)
+        desktop_notifications = st.checkbox("Desktop notifications", value=False)
+        
+        # Save settings
+        if st.form_submit_button("💾 Save Settings"):
+            st.success("✅ Settings saved successfully!")
     
-    # Save settings
-    if st.button("💾 Save Settings"):
-        st.success("✅ Settings saved successfully!")
+    reload_col, close_col = st.columns(2)
+    with reload_col:
+        st.button("🔄 Reload env", on_click=reload_env, help="Re-read the .env file")
+    with close_col:
+        st.button("✖️ Close Settings", on_click=close_settings)
+
+with tab4:
+    render_settings_tab()
 
 # Footer
-st.markdown("---")
-st.markdown(
-    '<div style="text-align: center; color: #666; margin-top: 2rem;">'
-    '🎫 RouteIQ Ticket Management System | Built with Streamlit'
-    '</div>',
-    unsafe_allow_html=True
-)
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
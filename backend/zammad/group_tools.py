@@ -1,6 +1,7 @@
 import os
 import sys
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from dotenv import load_dotenv
 
 # Ensure we can import sibling modules when running as a script
@@ -13,10 +14,10 @@ if PARENT_DIR not in sys.path:
 load_dotenv()
 
 try:
-    from zammad.zammad_integration import initialize_zammad_client
+    from zammad.zammad_integration import get_zammad_client, forget_lookup_maps
 except Exception as e:
     # Fallback absolute import if running from project root
-    from backend.zammad.zammad_integration import initialize_zammad_client  # type: ignore
+    from backend.zammad.zammad_integration import get_zammad_client, forget_lookup_maps  # type: ignore
 
 
 def _iter_groups(client) -> List[Dict[str, Any]]:
@@ -33,16 +34,48 @@ def _iter_groups(client) -> List[Dict[str, Any]]:
             raise RuntimeError(f"Failed to fetch groups: {e}")
 
 
+# id(client) -> (fetched_at, {lowercase name: group}); short TTL since groups can change in Zammad
+_GROUP_CACHE: Dict[int, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+_CACHE_TTL = 60
+
+
+def _groups_by_name(client) -> Dict[str, Dict[str, Any]]:
+    """Lowercase name -> group dict, fetched once per client every _CACHE_TTL seconds."""
+    key = id(client)
+    cached = _GROUP_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < _CACHE_TTL:
+        return cached[1]
+    groups: Dict[str, Dict[str, Any]] = {}
+    for g in _iter_groups(client):
+        # First match wins, as with the previous linear scan
+        groups.setdefault(str(g.get("name", "")).strip().lower(), g)
+    _GROUP_CACHE[key] = (time.monotonic(), groups)
+    return groups
+
+
+def invalidate_group_cache(client) -> None:
+    """Drop the cached groups for this client, e.g. after creating or renaming a group."""
+    _GROUP_CACHE.pop(id(client), None)
+    # Cached group maps (get_all_groups/get_lookup_maps) are stale too
+    forget_lookup_maps(client)
+
+
+def _remember_group(client, group) -> None:
+    """Add a just-created group to the cached index, so find-or-create loops don't refetch every group."""
+    forget_lookup_maps(client)
+    cached = _GROUP_CACHE.get(id(client))
+    if cached and isinstance(group, dict) and group.get("name"):
+        cached[1][str(group["name"]).strip().lower()] = group
+    else:
+        _GROUP_CACHE.pop(id(client), None)
+
+
 def get_group_by_name(client, name: str) -> Optional[Dict[str, Any]]:
     """Case-insensitive search for a group by name."""
     target = (name or "").strip().lower()
     if not target:
         return None
-    for g in _iter_groups(client):
-        gname = str(g.get("name", "")).strip().lower()
-        if gname == target:
-            return g
-    return None
+    return _groups_by_name(client).get(target)
 
 
 essential_group_defaults = {
@@ -70,29 +103,45 @@ def create_group(client, name: str, params: Optional[Dict[str, Any]] = None) ->
                 payload[k] = v
 
     created = client.group.create(params=payload)
+    # Cached group maps no longer list every group
+    _remember_group(client, created)
     # Some clients return created dict directly
     return created
 
 
-def find_or_create_group(client, name: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Return existing group (by name) or create it with params."""
+def find_or_create_group(
+    client,
+    name: str,
+    params: Optional[Dict[str, Any]] = None,
+    create_if_missing: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Return existing group (by name) or create it with params.
+    With create_if_missing=False a missing group yields None; the lookup is then a single cached dict get.
+    """
     existing = get_group_by_name(client, name)
-    if existing:
+    if existing or not create_if_missing:
         return existing
     return create_group(client, name, params)
 
 
-def ensure_group(client=None, name: str = "", params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def ensure_group(
+    client=None,
+    name: str = "",
+    params: Optional[Dict[str, Any]] = None,
+    create_if_missing: bool = True,
+) -> Optional[Dict[str, Any]]:
     """
     Public helper: initialize client if not provided, then find or create group by name.
     """
     if not client:
-        client = initialize_zammad_client()
-    return find_or_create_group(client, name, params)
+        client = get_zammad_client()
+    return find_or_create_group(client, name, params, create_if_missing=create_if_missing)
 
 
 __all__ = [
     "get_group_by_name",
+    "invalidate_group_cache",
     "create_group",
     "find_or_create_group",
     "ensure_group",
@@ -22,6 +22,7 @@ from zammad.group_tools import (
     get_group_by_name,
     create_group,
     find_or_create_group,
+    invalidate_group_cache,
 )
 
 
@@ -58,8 +59,8 @@ def cmd_create(args):
 
 def cmd_ensure(args):
     client = initialize_zammad_client()
-    created = find_or_create_group(client, args.name)
-    print(pretty(created))
+    created = find_or_create_group(client, args.name, create_if_missing=not args.no_create)
+    print(pretty(created or {}))
 
 
 def cmd_rename(args):
@@ -68,6 +69,7 @@ def cmd_rename(args):
     if not grp:
         raise SystemExit(f"Group not found: {args.old}")
     updated = client.group.update(grp["id"], params={"name": args.new})
+    invalidate_group_cache(client)
     print(pretty(updated))
 
 
@@ -90,6 +92,7 @@ def main():
 
     p_ensure = sub.add_parser("ensure", help="Find or create group by name")
     p_ensure.add_argument("name", help="Group name")
+    p_ensure.add_argument("--no-create", action="store_true", help="Only look the group up; never create it")
     p_ensure.set_defaults(func=cmd_ensure)
 
     p_rename = sub.add_parser("rename", help="Rename a group")
@@ -1,7 +1,7 @@
 import requests
 import json
 from pydantic import BaseModel, EmailStr, Field, validator
-from typing import List, Optional, Annotated, Literal, Dict, Any, Union
+from typing import List, Optional, Annotated, Literal, Dict, Any, Union, Tuple
 from dotenv import load_dotenv, find_dotenv
 import os
 import sys
@@ -11,10 +11,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import functions from zammad_integration
 from zammad.zammad_integration import (
-    initialize_zammad_client,
+    get_zammad_client,
     get_all_groups,
-    find_or_create_customer
+    find_or_create_customer,
+    PRIORITY_IDS,
 )
+from http_session import make_session
 
 # FastAPI ticket classifier service URL - using the local ticket classifier API
 API_URL = "http://127.0.0.1:8000/api/v1/"
@@ -24,6 +26,9 @@ HEALTH_URL = f"{API_URL}health"
 # Note: This implementation uses the local FastAPI ticket classifier service
 # instead of the GROQ API for ticket classification
 
+# Shared keep-alive session for classifier calls (health runs on every Streamlit rerun)
+_SESSION = make_session()
+
 load_dotenv(find_dotenv())
 
 class Customer(BaseModel):
@@ -52,8 +57,7 @@ class TicketPriority(BaseModel):
     @property
     def priority_id(self) -> int:
         """Convert priority string to Zammad priority ID"""
-        priority_mapping = {"low": 1, "normal": 2, "high": 3}
-        return priority_mapping[self.priority]
+        return PRIORITY_IDS[self.priority]
 
 class Ticket(BaseModel):
     """Pydantic model for ticket creation"""
@@ -96,10 +100,10 @@ class TicketClassifierResponse(BaseModel):
     error: Optional[str] = None
 
 # API Functions
-def check_classifier_health() -> Dict[str, Any]:
-    """Check if the ticket classifier API is healthy"""
+def check_classifier_health(timeout: Union[float, Tuple[float, float]] = 10) -> Dict[str, Any]:
+    """Check if the ticket classifier API is healthy; `timeout` is passed to requests as-is"""
     try:
-        response = requests.get(HEALTH_URL)
+        response = _SESSION.get(HEALTH_URL, timeout=timeout)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -109,7 +113,7 @@ def predict_ticket_category(description: str) -> Union[TicketClassifierResponse,
     """Predict ticket category using the FastAPI classifier service"""
     try:
         payload = {"description": description}
-        response = requests.post(PREDICT_URL, json=payload)
+        response = _SESSION.post(PREDICT_URL, json=payload)
         response.raise_for_status()
         return TicketClassifierResponse(**response.json())
     except requests.exceptions.RequestException as e:
@@ -126,7 +130,7 @@ def create_ticket(ticket: Ticket) -> Dict[str, Any]:
     """Create a ticket in Zammad using the provided ticket data"""
     try:
         # Initialize Zammad client
-        client = initialize_zammad_client()
+        client = get_zammad_client()
         
         # Find or create customer
         customer_id = find_or_create_customer(
@@ -14,15 +14,19 @@ if PARENT_DIR not in sys.path:
 load_dotenv()
 
 # Reuse models from existing zammad_api without modifying it
-from zammad.zammad_integration import initialize_zammad_client, get_all_groups, find_or_create_customer
+from zammad.zammad_integration import get_zammad_client, get_all_groups, find_or_create_customer
 from zammad.group_tools import ensure_group
 from zammad import zammad_api as base_api  # import existing models
+from http_session import make_session
 
 # Classifier URL configurable here independently of zammad_api
 API_URL = os.getenv("CLASSIFIER_API_URL", "http://127.0.0.1:8000/api/v1/")
 PREDICT_URL = f"{API_URL}predict"
 HEALTH_URL = f"{API_URL}health"
 
+# Classifier priority label (uppercase) -> TicketPriority value
+_PRIORITY_NAMES = {"LOW": "low", "NORMAL": "normal", "HIGH": "high"}
+
 # Type aliases from base_api for clarity
 Ticket = base_api.Ticket
 Customer = base_api.Customer
@@ -30,9 +34,13 @@ TicketPriority = base_api.TicketPriority
 TicketClassifierResponse = base_api.TicketClassifierResponse
 
 
+# Shared keep-alive session for classifier calls
+_SESSION = make_session()
+
+
 def check_classifier_health() -> Dict[str, Any]:
     try:
-        r = requests.get(HEALTH_URL, timeout=10)
+        r = _SESSION.get(HEALTH_URL, timeout=10)
         r.raise_for_status()
         return r.json()
     except requests.RequestException as e:
@@ -46,7 +54,7 @@ def predict_ticket_category(description: str) -> Dict[str, Any]:
     This avoids attribute errors when callers use .get().
     """
     try:
-        r = requests.post(PREDICT_URL, json={"description": description}, timeout=20)
+        r = _SESSION.post(PREDICT_URL, json={"description": description}, timeout=20)
         r.raise_for_status()
         data = r.json()
 
@@ -125,7 +133,7 @@ def create_ticket_with_autogroup(ticket: Ticket, prefix: str = "") -> Dict[str,
     """
     try:
         print("\n🔌 Initializing Zammad client...")
-        client = initialize_zammad_client()
+        client = get_zammad_client()
         
         print("📋 Fetching all groups...")
         groups = get_all_groups(client)
@@ -172,7 +180,7 @@ def create_ticket_with_autogroup(ticket: Ticket, prefix: str = "") -> Dict[str,
                     if "Name has already been taken" in msg:
                         # Another run likely created it; refresh groups and continue
                         print("   Detected duplicate-name response; refreshing groups and proceeding with existing group")
-                        groups = get_all_groups(client)
+                        groups = get_all_groups(client, refresh=True)
                         existing_name = next((n for n in groups.keys() if n.lower() == group_name.lower()), None)
                     else:
                         raise
@@ -203,8 +211,7 @@ def create_ticket_with_autogroup(ticket: Ticket, prefix: str = "") -> Dict[str,
             # Update ticket priority if available (TicketPriority is a Pydantic model, not Enum)
             if priority and hasattr(ticket, 'priority'):
                 try:
-                    pr_map = {"LOW": "low", "NORMAL": "normal", "HIGH": "high"}
-                    normalized = pr_map.get(str(priority).upper(), "normal")
+                    normalized = _PRIORITY_NAMES.get(str(priority).upper(), "normal")
                     # If ticket.priority is already a TicketPriority instance, update its field
                     if isinstance(ticket.priority, TicketPriority):
                         ticket.priority.priority = normalized
@@ -237,7 +244,7 @@ def create_ticket_with_autogroup(ticket: Ticket, prefix: str = "") -> Dict[str,
                     msg = str(ce)
                     if "Name has already been taken" in msg:
                         print("   Detected duplicate-name response; refreshing groups and proceeding with existing group")
-                        groups = get_all_groups(client)
+                        groups = get_all_groups(client, refresh=True)
                         existing_name = next((n for n in groups.keys() if n.lower() == dept_name.lower()), None)
                     else:
                         raise
@@ -368,7 +375,7 @@ if __name__ == "__main__":
         # Get group name from return or fetch from API
         resolved_group_name = result.get('resolved_group')
         if not resolved_group_name:
-            client = initialize_zammad_client()
+            client = get_zammad_client()
             groups = get_all_groups(client)
             resolved_group_name = next((name for name, gid in groups.items() if gid == group_id), f"ID {group_id}")
         
@@ -1,11 +1,20 @@
 import os
 import json
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from dotenv import load_dotenv, find_dotenv
 
 from zammad_py import ZammadAPI
 from typing import Dict
 
+try:
+    from http_session import make_session
+except ImportError:
+    # Fallback absolute import when loaded as part of the backend package
+    from backend.http_session import make_session  # type: ignore
+
 # Load environment variables from project root .env regardless of current working directory
 load_dotenv(find_dotenv(usecwd=True), override=True)
 
@@ -44,33 +53,43 @@ def initialize_zammad_client():
     except Exception as e:
         raise RuntimeError(f"Failed to initialize Zammad client: {str(e)}")
 
+# Classifier priority label (lowercase) -> Zammad priority_id; unknown labels fall back to 2 (normal)
+PRIORITY_IDS = {"low": 1, "normal": 2, "medium": 2, "high": 3}
+
 # Note: Do not initialize a global client at import time.
 # This module is also used by a FastAPI app; failing here would crash the server.
 client = None  # For backwards compatibility in scripts; initialized in main()
 
+_shared_client = None
+
+def get_zammad_client():
+    """
+    Return a process-wide Zammad client, creating it on first use.
+    Reusing one client keeps its HTTP connection pool (and the per-client caches below) warm
+    instead of re-authenticating on every request.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = initialize_zammad_client()
+    return _shared_client
+
 
-def get_all_groups(client_obj) -> Dict[str, int]:
+def get_all_groups(client_obj, refresh: bool = False) -> Dict[str, int]:
     """
     Retrieves all Zammad groups and returns a dictionary mapping group names to IDs.
+    Served from the `get_lookup_maps` cache, so ticket creation doesn't sweep groups every time;
+    pass refresh=True to re-read them (e.g. after a "name already taken" error).
     Falls back gracefully if any error occurs.
     """
-    groups_map: Dict[str, int] = {}
-    print("\n--- Fetching Zammad Groups (Departments) ---")
     try:
-        groups = list(client_obj.group.all())  # Most Zammad client versions expect no args
-        if not groups:
-            print("No groups found in your Zammad instance.")
-        else:
-            for group in groups:
-                group_id = group.get("id")
-                group_name = group.get("name")
-                if group_id and group_name:
-                    groups_map[group_name] = group_id
-                    print(f"  ID: {group_id}, Name: {group_name}")
+        groups = get_lookup_maps(client_obj, refresh=refresh).get("groups") or {}
     except Exception as e:
         print(f"Warning: Unable to fetch groups: {e}")
-    print("---------------------------------------------")
-    return groups_map
+        return {}
+    if not groups:
+        print("No groups found in your Zammad instance.")
+    # A fresh dict each call; callers add newly created groups to it
+    return {name: group_id for group_id, name in groups.items()}
 
 
 def _ticket_to_dict(ticket: dict) -> dict:
@@ -91,46 +110,283 @@ def _ticket_to_dict(ticket: dict) -> dict:
         return {"error": f"failed to serialize ticket: {e}"}
 
 
-def list_tickets(client_obj, state_id: int | None = None, limit: int = 50) -> list[dict]:
-    """Return a list of tickets from Zammad as dicts. Optional filter by state_id and limit results."""
+def _iter_resource(resource, start_page: int = 1, max_pages: int | None = None, filters: dict | None = None):
+    """Yield items of a zammad_py resource lazily from `start_page` on, following pagination page by page.
+    `filters` (extra query params such as sort order) are sent with every page."""
+    return _iter_pages(resource.all(page=start_page, filters=filters), max_pages)
+
+
+def _iter_pages(page, max_pages: int | None = None):
+    """Yield items from a zammad_py Pagination (from `all()` or `search()`) and the pages after it,
+    stopping after `max_pages` pages when given."""
+    fetched = 1
+    while page:
+        items = list(page)
+        if not items:
+            break
+        yield from items
+        next_page = getattr(page, "next_page", None)
+        if next_page is None or (max_pages is not None and fetched >= max_pages):
+            break
+        page = next_page()
+        fetched += 1
+
+
+# Reference data (states, priorities, groups) is small; sweep it in a few large pages rather than 10-item ones
+LOOKUP_PAGE_SIZE = 100
+
+def _sweep_resource(resource) -> list[dict]:
+    """Every item of a small reference resource, fetched LOOKUP_PAGE_SIZE per request."""
+    if hasattr(resource, "per_page"):
+        resource.per_page = LOOKUP_PAGE_SIZE
+    return list(_iter_resource(resource))
+
+
+# The search sweep reads at most SEARCH_SCAN_MAX_PAGES pages of SEARCH_SCAN_PAGE_SIZE tickets, so a query
+# with no match (a typo) costs a bounded number of upstream requests instead of one per 10 tickets in Zammad
+SEARCH_SCAN_PAGE_SIZE = 100
+SEARCH_SCAN_MAX_PAGES = 20
+# Newest tickets first, so a sweep that stops at its cap has covered the recent tickets, not the oldest ones
+SEARCH_SCAN_ORDER = {"sort_by": "created_at", "order_by": "desc"}
+
+def _scan_tickets(client_obj):
+    """Yield tickets for the search sweep, newest first, at most SEARCH_SCAN_PAGE_SIZE * SEARCH_SCAN_MAX_PAGES of them."""
+    resource = client_obj.ticket
+    if hasattr(resource, "per_page"):
+        resource.per_page = SEARCH_SCAN_PAGE_SIZE
+    return _iter_resource(resource, max_pages=SEARCH_SCAN_MAX_PAGES, filters=dict(SEARCH_SCAN_ORDER))
+
+
+def _search_all(resource, query: str):
+    """Yield every match of a zammad_py search across all result pages, SEARCH_SCAN_PAGE_SIZE per request."""
+    if hasattr(resource, "per_page"):
+        resource.per_page = SEARCH_SCAN_PAGE_SIZE
+    return _iter_pages(resource.search(query))
+
+
+def list_tickets(client_obj, state_id: int | None = None, limit: int = 50, offset: int = 0) -> list[dict]:
+    """Return a page of tickets from Zammad as dicts. Optional filter by state_id; `offset`/`limit` select the page."""
     try:
-        items: list[dict] = []
-        # Most zammad-py versions support .ticket.all(); .ticket.search could be used for filtering
-        tickets = list(client_obj.ticket.all())
-        for t in tickets:
-            if state_id is not None and t.get("state_id") != state_id:
-                continue
-            items.append(_ticket_to_dict(t))
-            if len(items) >= max(1, int(limit)):
-                break
-        return items
+        start = max(0, int(offset))
+        limit = max(1, int(limit))
+        start_page = 1
+        resource = client_obj.ticket
+        if hasattr(resource, "per_page"):
+            # Fetch `limit` tickets per upstream request (zammad_py defaults to 10), so an aligned page is one call
+            resource.per_page = limit
+        per_page = getattr(resource, "per_page", None)
+        if state_id is None and isinstance(per_page, int) and per_page > 0:
+            # Jump straight to the server page holding `offset` instead of walking from page 1
+            start_page, start = divmod(start, per_page)
+            start_page += 1
+        tickets = _iter_resource(resource, start_page)
+        if state_id is not None:
+            tickets = (t for t in tickets if t.get("state_id") == state_id)
+        page = islice(tickets, start, start + limit)
+        return [_ticket_to_dict(t) for t in page]
     except Exception as e:
         raise RuntimeError(f"Failed to list Zammad tickets: {e}")
 
-def _safe_get_states(client_obj) -> list[dict]:
-    """Best-effort retrieval of ticket states as list of dicts."""
+def search_tickets(client_obj, query: str, field: str = "title", limit: int = 50) -> tuple[list[dict], bool]:
+    """
+    Return `(tickets, truncated)`: up to `limit` tickets whose title (field="title") or customer email
+    (field="email") matches `query`, case-insensitively, as found by Zammad's ticket search. A bounded sweep
+    (see `_scan_tickets`) stands in only when the search itself fails (e.g. no search index); `truncated`
+    is True when that sweep stopped at its cap, so older tickets were not checked.
+    """
+    query = (query or "").strip()
+    # casefold once; matching is then a plain substring test per ticket
+    q = query.casefold()
+    if not q:
+        return [], False
     try:
-        # Common in zammad_py
-        return list(client_obj.ticket_state.all())
+        if field == "email":
+            customer_ids = {
+                user.get("id") for user in _search_all(client_obj.user, query)
+                if q in (user.get("email") or "").casefold()
+            }
+            if not customer_ids:
+                return [], False
+            search_query = "customer_id:(" + " OR ".join(map(str, sorted(customer_ids))) + ")"
+            keep = lambda t: t.get("customer_id") in customer_ids
+        else:
+            search_query = query
+            keep = lambda t: q in (t.get("title") or "").casefold()
+        tickets, truncated = _search_or_scan(client_obj, search_query, keep, limit)
+        return [_ticket_to_dict(t) for t in tickets], truncated
+    except Exception as e:
+        raise RuntimeError(f"Failed to search Zammad tickets: {e}")
+
+
+def _search_or_scan(client_obj, search_query: str, keep, limit: int) -> tuple[list[dict], bool]:
+    """
+    `(tickets, truncated)`: up to `limit` tickets passing `keep`, from Zammad's ticket search. A short index
+    result is final: the index matches whole words, so "net" does not find "network". The sweep, which lists
+    tickets page by page, runs only when the search request fails; `truncated` flags a sweep cut off by its cap.
+    """
+    n = max(1, int(limit))
+    try:
+        tickets = _iter_pages(client_obj.ticket.search(search_query))
     except Exception:
         pass
+    else:
+        return list(islice((t for t in tickets if keep(t)), n)), False
+    found, scanned = [], 0
+    for t in _scan_tickets(client_obj):
+        scanned += 1
+        if keep(t):
+            found.append(t)
+            if len(found) == n:
+                break
+    return found, len(found) < n and scanned >= SEARCH_SCAN_PAGE_SIZE * SEARCH_SCAN_MAX_PAGES
+
+
+def _get_states(client_obj) -> list[dict]:
+    """Ticket states as list of dicts; raises when neither states resource can be read."""
     try:
+        # Common in zammad_py
+        return _sweep_resource(client_obj.ticket_state)
+    except Exception:
         # Some variants expose `state`
-        return list(client_obj.state.all())
+        return _sweep_resource(client_obj.state)
+
+def _safe_get_states(client_obj) -> list[dict]:
+    """Best-effort retrieval of ticket states as list of dicts."""
+    try:
+        return _get_states(client_obj)
     except Exception:
         return []
 
+# id(client) -> {lowercased state name: state_id}; ticket states rarely change at runtime
+_state_ids_cache: dict[int, dict[str, int]] = {}
+
+def _state_ids_by_name(client_obj, refresh: bool = False) -> dict[str, int]:
+    """Return a cached lowercase state-name -> state_id map for this client."""
+    key = id(client_obj)
+    if refresh or key not in _state_ids_cache:
+        _state_ids_cache[key] = {
+            (st.get("name") or "").lower(): st.get("id")
+            for st in _safe_get_states(client_obj)
+            if st.get("id")
+        }
+    return _state_ids_cache[key]
+
+# id(client) -> (fetched_at, lookup maps); names change rarely, so reuse them for a few minutes
+_lookup_maps_cache: dict[int, tuple[float, dict[str, dict[int, str]]]] = {}
+LOOKUP_MAPS_TTL = 300
+
+def get_lookup_maps(client_obj, refresh: bool = False) -> dict[str, dict[int, str]]:
+    """
+    Return id -> name maps for ticket states, priorities and groups.
+    One paginated sweep per resource, so callers can label any number of tickets without per-ticket lookups.
+    Results are cached per client for LOOKUP_MAPS_TTL seconds. If any sweep fails this raises and
+    caches nothing, so one transient Zammad error doesn't blank the names until the TTL runs out.
+    """
+    key = id(client_obj)
+    cached = _lookup_maps_cache.get(key)
+    if not refresh and cached and time.monotonic() - cached[0] < LOOKUP_MAPS_TTL:
+        return cached[1]
+    maps = _fetch_lookup_maps(client_obj)
+    _lookup_maps_cache[key] = (time.monotonic(), maps)
+    return maps
+
+def forget_lookup_maps(client_obj) -> None:
+    """Drop the cached lookup maps for this client, e.g. after creating a group."""
+    _lookup_maps_cache.pop(id(client_obj), None)
+
+def _fetch_lookup_maps(client_obj) -> dict[str, dict[int, str]]:
+    """Sweep states, priorities and groups from Zammad into id -> name maps; raises if any sweep fails."""
+    def names(items) -> dict[int, str]:
+        return {item.get("id"): item.get("name") for item in items if item.get("id") and item.get("name")}
+
+    def fetch(resource: str) -> list[dict]:
+        return _sweep_resource(getattr(client_obj, resource))
+
+    # The three sweeps are independent, so run them concurrently: latency ~ the slowest one
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        states = pool.submit(_get_states, client_obj)
+        priorities = pool.submit(fetch, "ticket_priority")
+        groups = pool.submit(fetch, "group")
+        return {
+            "states": names(states.result()),
+            "priorities": names(priorities.result()),
+            "groups": names(groups.result()),
+        }
+
+# (id(client), user_id) -> display name; names of existing users are stable enough to keep for the process
+_customer_names_cache: dict[tuple[int, int], str] = {}
+
+def _customer_display_name(user: dict) -> str | None:
+    """'First Last (email)' for a Zammad user, or None if it has none of those fields."""
+    parts = [user.get("firstname"), user.get("lastname")]
+    if user.get("email"):
+        parts.append(f"({user['email']})")
+    return " ".join(p for p in parts if p) or None
+
+def get_customer_names(client_obj, customer_ids, max_workers: int = 8) -> dict[int, str]:
+    """
+    Return user_id -> display name for `customer_ids`.
+    Cached names are reused; the remaining distinct ids are fetched with one user search, and any the
+    search misses (e.g. no search index) are fetched concurrently. Unknown ids are omitted.
+    """
+    key = id(client_obj)
+    wanted = {int(uid) for uid in customer_ids if uid}
+    missing = [uid for uid in wanted if (key, uid) not in _customer_names_cache]
+
+    def fetch(uid: int) -> str | None:
+        try:
+            return _customer_display_name(client_obj.user.find(uid) or {})
+        except Exception:
+            return None
+
+    if missing:
+        # One search covers the whole batch; only ids it doesn't return are looked up one by one
+        try:
+            batch = set(missing)
+            for user in _iter_pages(client_obj.user.search("id:(" + " OR ".join(map(str, missing)) + ")")):
+                uid, name = user.get("id"), _customer_display_name(user)
+                if uid in batch and name:
+                    _customer_names_cache[(key, uid)] = name
+        except Exception:
+            pass
+        missing = [uid for uid in missing if (key, uid) not in _customer_names_cache]
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as pool:
+            for uid, name in zip(missing, pool.map(fetch, missing)):
+                if name:
+                    _customer_names_cache[(key, uid)] = name
+    return {uid: _customer_names_cache[(key, uid)] for uid in wanted if (key, uid) in _customer_names_cache}
+
+def resolve_refs(client_obj, state_ids=(), priority_ids=(), customer_ids=(), group_ids=()) -> dict[str, dict[int, str]]:
+    """Resolve the given reference IDs to names in one call: {states, priorities, customers, groups}."""
+    try:
+        maps = get_lookup_maps(client_obj)
+    except Exception:
+        # Failed sweeps are not cached; resolve the customers now and let the next call retry the rest
+        maps = {"states": {}, "priorities": {}, "groups": {}}
+
+    def pick(names: dict[int, str], ids) -> dict[int, str]:
+        return {i: names[i] for i in ids if i in names}
+
+    return {
+        "states": pick(maps["states"], state_ids),
+        "priorities": pick(maps["priorities"], priority_ids),
+        "customers": get_customer_names(client_obj, customer_ids) if customer_ids else {},
+        "groups": pick(maps["groups"], group_ids),
+    }
+
 def find_state_id_by_name(client_obj, name: str) -> int | None:
     """
     Find a ticket state_id by its human name (case-insensitive). Returns None if not found.
+    Served from a per-client cache; refreshed once on a miss in case states were added.
     """
     try:
         target = (name or "").strip().lower()
-        for st in _safe_get_states(client_obj):
-            n = (st.get("name") or "").lower()
-            if n == target:
-                return st.get("id")
-        return None
+        sid = _state_ids_by_name(client_obj).get(target)
+        if sid is None:
+            sid = _state_ids_by_name(client_obj, refresh=True).get(target)
+        return sid
     except Exception:
         return None
 
@@ -173,6 +429,14 @@ def get_ticket(client_obj, ticket_id: int) -> dict:
     except Exception as e:
         raise RuntimeError(f"Failed to get ticket {ticket_id}: {e}")
 
+def _update_applied(updated, ticket_id: int, params: dict) -> bool:
+    """True if an update response is the ticket with every field in `params` (articles aside) set."""
+    return (
+        isinstance(updated, dict)
+        and updated.get("id") == ticket_id
+        and all(updated.get(key) == value for key, value in params.items() if key != "article")
+    )
+
 def update_ticket(client_obj, ticket_id: int, updates: dict) -> dict:
     """
     Update a ticket with robust fallbacks across SDK variants and raw HTTP.
@@ -252,27 +516,28 @@ def update_ticket(client_obj, ticket_id: int, updates: dict) -> dict:
         updated = None
         need_article = False
 
-        # v1: kwargs fields (no params wrapper) — some SDKs don't support this
+        # v3: params= wrapper (kwargs) — zammad_py's own `update(id, params)` signature, so tried first;
+        # the common case then skips two signature mismatches before its single PUT
         try:
-            updated = client_obj.ticket.update(id=ticket_id, **params)
+            updated = client_obj.ticket.update(id=ticket_id, params=params)
         except Exception as e:
-            update_attempts.append(f"v1(kwargs): {e}")
+            update_attempts.append(f"v3(kwargs params=): {e}")
+            if "article body" in str(e).lower():
+                need_article = True
 
-        # v2: positional id + kwargs
+        # v1: kwargs fields (no params wrapper) — some SDKs don't support this
         if updated is None:
             try:
-                updated = client_obj.ticket.update(ticket_id, **params)
+                updated = client_obj.ticket.update(id=ticket_id, **params)
             except Exception as e:
-                update_attempts.append(f"v2(positional+kwargs): {e}")
+                update_attempts.append(f"v1(kwargs): {e}")
 
-        # v3: params= wrapper (kwargs)
+        # v2: positional id + kwargs
         if updated is None:
             try:
-                updated = client_obj.ticket.update(id=ticket_id, params=params)
+                updated = client_obj.ticket.update(ticket_id, **params)
             except Exception as e:
-                update_attempts.append(f"v3(kwargs params=): {e}")
-                if "article body" in str(e).lower():
-                    need_article = True
+                update_attempts.append(f"v2(positional+kwargs): {e}")
 
         # v4: positional id + params=
         if updated is None:
@@ -317,6 +582,11 @@ def update_ticket(client_obj, ticket_id: int, updates: dict) -> dict:
             except Exception as e:
                 update_attempts.append(f"raw_http: {e}")
 
+        # The update response is the ticket after the write; when it shows every requested field
+        # applied, serialize it directly instead of spending another round-trip re-fetching it
+        if _update_applied(updated, ticket_id, params):
+            return _ticket_to_dict(updated)
+
         # Fetch and return latest ticket state (avoid stale/cached SDK objects)
         latest = get_ticket(client_obj, ticket_id)
 
@@ -329,6 +599,9 @@ def update_ticket(client_obj, ticket_id: int, updates: dict) -> dict:
     except Exception as e:
         raise RuntimeError(f"Failed to update ticket {ticket_id}: {e}")
 
+# Keep-alive session for the raw REST fallback, so bulk updates don't reconnect per ticket
+_RAW_SESSION = make_session()
+
 def _http_update_ticket(ticket_id: int, params: dict) -> dict:
     """
     Low-level HTTP PUT update to Zammad REST API as a fallback.
@@ -369,7 +642,7 @@ def _http_update_ticket(ticket_id: int, params: dict) -> dict:
         payload["article"]["content_type"] = "text/plain"
 
     # Try PUT first
-    resp = requests.put(url, json=payload, headers=headers, auth=auth, timeout=15)
+    resp = _RAW_SESSION.put(url, json=payload, headers=headers, auth=auth, timeout=15)
     if resp.status_code in (400, 422):
         # If server complains about article, add minimal article and retry once
         body_lower = (resp.text or "").lower()
@@ -381,11 +654,11 @@ def _http_update_ticket(ticket_id: int, params: dict) -> dict:
                 "internal": bool(payload.get("article", {}).get("internal", False)),
                 "content_type": "text/plain",
             }
-            resp = requests.put(url, json=payload, headers=headers, auth=auth, timeout=15)
+            resp = _RAW_SESSION.put(url, json=payload, headers=headers, auth=auth, timeout=15)
 
     # Fallback to PATCH if PUT not accepted
     if resp.status_code in (405, 415, 422):
-        resp = requests.patch(url, json=payload, headers=headers, auth=auth, timeout=15)
+        resp = _RAW_SESSION.patch(url, json=payload, headers=headers, auth=auth, timeout=15)
 
     try:
         resp.raise_for_status()
@@ -421,6 +694,49 @@ def delete_ticket(client_obj, ticket_id: int) -> dict:
         except Exception as close_err:
             raise RuntimeError(f"Failed to delete/close ticket: destroy_error={destroy_err}; close_error={close_err}")
 
+def _run_bulk(fn, ticket_ids: list[int], max_workers: int) -> dict:
+    """Run `fn(ticket_id)` for each id on a small thread pool; collect successes and per-id errors."""
+    succeeded: list[int] = []
+    failed: dict[int, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ticket_ids)))) as pool:
+        futures = {pool.submit(fn, tid): tid for tid in ticket_ids}
+        for future in as_completed(futures):
+            tid = futures[future]
+            try:
+                future.result()
+                succeeded.append(tid)
+            except Exception as e:
+                failed[tid] = str(e)
+    return {"succeeded": sorted(succeeded), "failed": failed}
+
+def bulk_update_tickets(client_obj, ticket_ids: list[int], updates: dict, max_workers: int = 4) -> dict:
+    """
+    Apply the same partial `updates` to many tickets concurrently.
+    Returns {"succeeded": [ids], "failed": {id: error}}.
+    """
+    # Resolve a state name once instead of once per ticket
+    if updates.get("state") and updates.get("state_id") is None:
+        sid = find_state_id_by_name(client_obj, str(updates["state"]))
+        if sid:
+            updates = {**updates, "state_id": sid}
+    return _run_bulk(lambda tid: update_ticket(client_obj, tid, updates), ticket_ids, max_workers)
+
+def bulk_delete_tickets(client_obj, ticket_ids: list[int], max_workers: int = 4) -> dict:
+    """
+    Delete (or close) many tickets concurrently using `delete_ticket` fallbacks.
+    Returns {"succeeded": [ids], "failed": {id: error}, "closed": [ids]}; `closed` lists the
+    succeeded ids that were closed rather than destroyed, so callers know they still exist.
+    """
+    closed: list[int] = []
+
+    def delete(tid: int) -> None:
+        if delete_ticket(client_obj, tid).get("message") == "Ticket closed":
+            closed.append(tid)
+
+    result = _run_bulk(delete, ticket_ids, max_workers)
+    result["closed"] = sorted(closed)
+    return result
+
 def validate_email(email: str) -> bool:
     """Basic email validation"""
     import re
@@ -607,8 +923,7 @@ def create_ticket_flow(client_obj, interactive=False):
     # --- Priority Selection ---
     priority_id = 2  # Default to normal priority
     if classified_priority != "Unknown":
-        priority_mapping = {"low": 1, "normal": 2, "high": 3}
-        priority_id = priority_mapping.get(classified_priority.lower(), 2)
+        priority_id = PRIORITY_IDS.get(classified_priority.lower().strip(), 2)
     elif interactive:
         while True:
             try:
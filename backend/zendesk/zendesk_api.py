@@ -11,6 +11,16 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import functions from zendesk_integration
 from zendesk.zendesk_integration import ZendeskIntegration
+from http_session import make_session
+
+_zendesk_integration = None
+
+def get_zendesk_integration() -> ZendeskIntegration:
+    """Return a shared ZendeskIntegration so the Zenpy session is reused across requests"""
+    global _zendesk_integration
+    if _zendesk_integration is None:
+        _zendesk_integration = ZendeskIntegration()
+    return _zendesk_integration
 
 # FastAPI ticket classifier service URL - using the local ticket classifier API
 API_URL = "http://127.0.0.1:8000/api/v1/"
@@ -95,11 +105,14 @@ class TicketClassifierResponse(BaseModel):
     success: bool = True
     error: Optional[str] = None
 
+# Shared keep-alive session for classifier calls
+_SESSION = make_session()
+
 # API Functions
 def check_classifier_health() -> Dict[str, Any]:
     """Check if the ticket classifier API is healthy"""
     try:
-        response = requests.get(HEALTH_URL)
+        response = _SESSION.get(HEALTH_URL)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -109,7 +122,7 @@ def predict_ticket_category(description: str) -> Union[TicketClassifierResponse,
     """Predict ticket category using the FastAPI classifier service"""
     try:
         payload = {"description": description}
-        response = requests.post(PREDICT_URL, json=payload)
+        response = _SESSION.post(PREDICT_URL, json=payload)
         response.raise_for_status()
         return TicketClassifierResponse(**response.json())
     except requests.exceptions.RequestException as e:
@@ -126,7 +139,7 @@ def create_ticket(ticket: Ticket) -> Dict[str, Any]:
     """Create a ticket in Zendesk using the provided ticket data"""
     try:
         # Initialize Zendesk integration
-        zendesk_integration = ZendeskIntegration()
+        zendesk_integration = get_zendesk_integration()
         
         # Find or create customer
         customer = zendesk_integration.search_user(ticket.customer.email)
@@ -191,12 +204,9 @@ def create_ticket_with_classification(
     """Create a ticket with automatic classification using FastAPI service"""
     try:
         # Initialize Zendesk integration
-        zendesk_integration = ZendeskIntegration()
+        zendesk_integration = get_zendesk_integration()
         
-        # Classify the ticket description
-        classification = predict_ticket_category(ticket_description)
-        
-        # Create ticket using the existing integration method
+        # Create ticket using the existing integration method; it classifies the description itself
         result = zendesk_integration.create_ticket_with_classification(
             customer_email=customer_email,
             customer_name=customer_name,
@@ -207,11 +217,11 @@ def create_ticket_with_classification(
             auto_proceed=True
         )
         
-        # Add classification info to the result
+        # Add classification info to the result, reusing the integration's call instead of classifying twice
         if result.get("success"):
             result["classification"] = {
-                "department": classification.department if classification.success else "Unknown",
-                "priority": classification.priority if classification.success else "Normal"
+                "department": result.get("department") or "Unknown",
+                "priority": result.get("priority") or "Normal"
             }
         
         return result
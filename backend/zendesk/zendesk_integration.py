@@ -6,6 +6,12 @@ from zenpy import Zenpy
 from zenpy.lib.api_objects import Ticket, User, Group, GroupMembership
 from pathlib import Path
 
+try:
+    from http_session import make_session
+except ImportError:
+    # Fallback absolute import when loaded as part of the backend package
+    from backend.http_session import make_session  # type: ignore
+
 # Load environment variables from project root .env regardless of current working directory
 load_dotenv(find_dotenv(usecwd=True), override=True)
 
@@ -57,6 +63,8 @@ class ZendeskIntegration:
         self.API_URL = "http://127.0.0.1:8000/api/v1/"
         self.PREDICT_URL = f"{self.API_URL}predict"
         self.HEALTH_URL = f"{self.API_URL}health"
+        # Keep-alive session so repeated classifications reuse one connection
+        self._session = make_session()
         
         # Note: This implementation uses the local FastAPI ticket classifier service
         # instead of the GROQ API for ticket classification
@@ -68,7 +76,7 @@ class ZendeskIntegration:
         """
         try:
             payload = {"description": description}
-            response = requests.post(self.PREDICT_URL, json=payload)
+            response = self._session.post(self.PREDICT_URL, json=payload)
             response.raise_for_status()
             
             classification_result = response.json()
@@ -145,11 +153,11 @@ class ZendeskIntegration:
             }
 
     def search_user(self, email):
-        users = list(self.zenpy_client.users.search(f"email:{email}"))
-        if users:
+        # Only the first match is used, so stop paging as soon as one arrives
+        user = next(iter(self.zenpy_client.users.search(f"email:{email}")), None)
+        if user is not None:
             print(f"User with email '{email}' found.")
-            return users[0]
-        return None
+        return user
 
     def find_or_create_group(self, group_name):
         """
@@ -157,10 +165,10 @@ class ZendeskIntegration:
         Returns the group object with its ID.
         """
         try:
-            # Search for existing group by name
-            groups = list(self.zenpy_client.groups())
-            for group in groups:
-                if group.name.lower() == group_name.lower():
+            # Search for existing group by name; iterate lazily so paging stops at the first match
+            wanted = group_name.lower()
+            for group in self.zenpy_client.groups():
+                if group.name.lower() == wanted:
                     print(f"Found existing group: {group.name} (ID: {group.id})")
                     return group
             